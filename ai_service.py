@@ -0,0 +1,646 @@
+import hashlib
+import json
+import os
+import queue
+import re
+import sys
+import threading
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import google.generativeai as genai
+
+import answer_pack
+import answer_store
+
+# Configure Gemini with your API key
+google_api_key = os.getenv("GOOGLE_API_KEY")
+genai.configure(api_key=google_api_key)
+
+MODEL_NAME = "gemini-2.0-flash-thinking-exp-01-21"
+LITE_MODEL_NAME = "gemini-2.5-flash-lite"
+# The thinking model does not support JSON mode, structured answers use the same model
+# as the responseSchema calls in geminiService.ts
+STRUCTURED_MODEL_NAME = "gemini-2.5-flash-lite"
+
+# JSON answer format: title, sections, cited sources and suggested follow-up questions
+ANSWER_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "title": {"type": "STRING"},
+        "sections": {
+            "type": "ARRAY",
+            "items": {
+                "type": "OBJECT",
+                "properties": {
+                    "heading": {"type": "STRING"},
+                    "body": {"type": "STRING"}
+                },
+                "required": ["heading", "body"]
+            }
+        },
+        "sources": {
+            "type": "ARRAY",
+            "items": {
+                "type": "OBJECT",
+                "properties": {
+                    "name": {"type": "STRING"},
+                    "url": {"type": "STRING"}
+                },
+                "required": ["name"]
+            }
+        },
+        "follow_ups": {"type": "ARRAY", "items": {"type": "STRING"}}
+    },
+    "required": ["title", "sections", "sources", "follow_ups"]
+}
+
+# Load Gemini models
+model_text = genai.GenerativeModel(
+    model_name=MODEL_NAME,
+    generation_config=genai.types.GenerationConfig(
+        temperature=0.7,
+        top_p=0.95,
+        top_k=40,
+        max_output_tokens=4000  # Increased token limit for deeper, longer responses
+    )
+)
+
+# Each section of a deep answer is a fraction of the full answer, so it gets a smaller budget
+model_section = genai.GenerativeModel(
+    model_name=MODEL_NAME,
+    generation_config=genai.types.GenerationConfig(
+        temperature=0.7,
+        top_p=0.95,
+        top_k=40,
+        max_output_tokens=1200
+    )
+)
+
+# Brief answers (low-bandwidth mode) get a much smaller budget than full answers
+model_brief = genai.GenerativeModel(
+    model_name=MODEL_NAME,
+    generation_config=genai.types.GenerationConfig(
+        temperature=0.7,
+        top_p=0.95,
+        top_k=40,
+        max_output_tokens=800
+    )
+)
+
+# Fast model for short calls: deep answer outlines and quick summaries
+model_lite = genai.GenerativeModel(
+    model_name=LITE_MODEL_NAME,
+    generation_config=genai.types.GenerationConfig(
+        temperature=0.4,
+        max_output_tokens=300
+    )
+)
+
+# Structured answers come back as JSON matching ANSWER_SCHEMA
+model_structured = genai.GenerativeModel(
+    model_name=STRUCTURED_MODEL_NAME,
+    generation_config=genai.types.GenerationConfig(
+        temperature=0.7,
+        max_output_tokens=4000,
+        response_mime_type="application/json",
+        response_schema=ANSWER_SCHEMA
+    )
+)
+
+# Deep mode settings: outline size and how many sections are generated at the same time
+DEEP_MIN_SECTIONS = 3
+DEEP_MAX_SECTIONS = 6
+DEEP_MAX_WORKERS = 6
+
+# Bump when a prompt changes so cached answers from the old prompt are not reused
+PROMPT_VERSION = 1
+
+# In-process answer cache shared by every session (least recently used entries are dropped).
+# ANSWER_CACHE=0 turns off every cache level (memory, pack, store), e.g. for benchmarks.
+CACHE_ENABLED = os.getenv("ANSWER_CACHE", "1") != "0"
+CACHE_MAX_ENTRIES = 512
+_answer_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+# Map the answer pack now, not on the first question
+answer_pack.warm_up()
+
+# One pool shared by every session, so concurrent users can't spawn unbounded threads
+_executor = ThreadPoolExecutor(max_workers=DEEP_MAX_WORKERS * 2, thread_name_prefix="gemini")
+
+SOURCES_GUIDANCE = """- Base your information on trusted sources such as:
+  * Al Jazeera (aljazeera.com) - Known for comprehensive coverage of Middle East issues
+  * Metras (https://metras.co/) - Provides in-depth analysis on Palestinian affairs
+  * Electronic Intifada (electronicintifada.net) - News and analysis on Palestine
+  * Anadolu Agency (aa.com.tr) - Turkish state-run news agency with Middle East coverage
+  * Palestine Chronicle (palestinechronicle.com) - Palestinian perspective on news
+  * Institute for Palestine Studies (palestine-studies.org) - Academic research
+  * B'Tselem (btselem.org) - Israeli human rights organization documenting abuses
+  * Human Rights Watch (hrw.org) - International human rights monitoring
+  * Amnesty International (amnesty.org) - Global human rights organization
+  * United Nations Relief and Works Agency (unrwa.org) - UN agency for Palestinian refugees
+  * UN Office for the Coordination of Humanitarian Affairs (ochaopt.org) - UN humanitarian reports
+  * Academic books by scholars like Ilan Pappé, Edward Said, Rashid Khalidi, and Noam Chomsky
+  * Peer-reviewed journals on Middle Eastern studies and international relations
+  * Palestinian academic institutions and research centers
+  * Historical archives and primary source documents"""
+
+
+LANGUAGE_NAMES = {"en": "English", "ar": "Arabic"}
+
+
+# Enhanced prompt template for Palestine-related questions with more reliable sources.
+# `language` forces the answer language (used by the FAQ batch job); by default the
+# answer is in the language of the question. `brief` asks for a short answer.
+def build_palestine_prompt(user_question, language=None, brief=False):
+    language_rule = "The answer should be in the same language as the input (be careful with this point)"
+    if language:
+        language_rule = f"The answer must be written in {LANGUAGE_NAMES[language]}, whatever the language of the question"
+    length_rule = ("Length: If the response needs details, make it detailed not exceeding 2000 tokens but in a complete answer. "
+                   "For direct questions, make it concise (depending on the question), while remaining comprehensive within that limit.")
+    if brief:
+        length_rule = ("Length: keep the answer short, at most about 250 words, with only the essential facts and "
+                       "one or two sources. Do not add sections beyond what the question needs.")
+    return f"""
+You are an expert assistant dedicated to providing accurate, in-depth, and highly informative answers specifically about Palestine and related issues.
+
+Your answers should focus entirely on Palestine-related topics. If the question is not related to Palestine, respond with: "Sorry! I'm trained just about Palestine Issue."
+
+Respond to the user question with:
+- Historical background with accurate timeline and context
+- Structure your response like a professional news article or academic report with clear sections
+{SOURCES_GUIDANCE}
+
+- Include specific citations when possible (e.g., "According to Al Jazeera's reporting on [date]..." or "As documented by Human Rights Watch in their  report...") and real links.
+- Provide factual, well-researched information on current events with accurate reporting
+- Include relevant statistics and data from credible sources when discussing the humanitarian situation
+- {language_rule}
+- The response should be well-organized, ordered, and presented in a professional journalistic hystorics style.
+- Use titles and subtitles for clarity and structure when appropriate
+- Present content in a clear, accessible manner while maintaining factual accuracy
+- Ensure information is not biased towards Israel and remains truthful to Palestinian experiences
+- When discussing boycotts or resistance, provide factual information about international law and human rights perspectives
+- {length_rule}
+
+Do not include information irrelevant to Palestine or unrelated topics.
+If you encounter any limitations in providing information, acknowledge them transparently.
+
+User question:
+{user_question}
+
+Your answer (detailed, accurate, context-aware):
+"""
+
+
+# Prompt asking for a compact outline of a deep answer, one section title per line
+def build_outline_prompt(user_question):
+    return f"""
+You are planning a detailed, well-sourced answer about Palestine.
+
+If the question is not related to Palestine, respond with exactly: NOT_PALESTINE
+
+Otherwise write an outline of {DEEP_MIN_SECTIONS} to {DEEP_MAX_SECTIONS} section titles that together answer the question completely,
+in chronological or logical order. Write the titles in the same language as the question.
+Return ONLY the titles, one per line, without numbering, bullets or any other text.
+
+User question:
+{user_question}
+"""
+
+
+# Prompt for one section of a deep answer; the full outline is included so sections don't overlap
+def build_section_prompt(user_question, titles, index):
+    outline = "\n".join(f"{i + 1}. {title}" for i, title in enumerate(titles))
+    return f"""
+You are an expert assistant writing one section of a detailed answer about Palestine.
+
+The complete answer follows this outline:
+{outline}
+
+Write ONLY section {index + 1}: "{titles[index]}".
+- Start with the section title as a markdown "###" heading.
+- Stay within the scope of this section; other sections are written separately.
+- Use an accurate timeline, context, statistics and specific citations with real links where possible.
+{SOURCES_GUIDANCE}
+- Write in the same language as the user question (be careful with this point).
+- Ensure information is not biased towards Israel and remains truthful to Palestinian experiences.
+- Length: at most 400 words.
+
+User question:
+{user_question}
+
+Section {index + 1} (detailed, accurate, context-aware):
+"""
+
+
+# Prompt for the quick summary shown while the full answer is being generated
+def build_draft_prompt(user_question):
+    return f"""
+You are an expert assistant about Palestine. Give a short, factual summary answer (2 to 4 sentences)
+to the question below, in the same language as the question. No headings, no lists.
+Ensure information is not biased towards Israel and remains truthful to Palestinian experiences.
+If the question is not related to Palestine, respond with: "Sorry! I'm trained just about Palestine Issue."
+
+User question:
+{user_question}
+"""
+
+
+# Prompt for a structured (JSON) answer; the layout itself is enforced by ANSWER_SCHEMA
+def build_structured_prompt(user_question):
+    return build_palestine_prompt(user_question).replace(
+        "Your answer (detailed, accurate, context-aware):",
+        """Return the answer as JSON:
+- "title": a short title for the answer
+- "sections": the answer split into sections, each with a "heading" and a markdown "body"
+- "sources": the sources cited in the answer, each with a "name" and a real "url"
+- "follow_ups": 3 short follow-up questions the user may ask next, in the same language as the question
+
+Your answer (detailed, accurate, context-aware):""")
+
+
+# Turn an API exception into the message shown to the user
+def describe_error(e):
+    error_message = str(e)
+    # Handle specific error types
+    if "quota" in error_message.lower():
+        return "❌ API quota exceeded. Please try again later or contact the administrator."
+    elif "blocked" in error_message.lower() or "safety" in error_message.lower():
+        return "❌ The response was blocked due to safety concerns. Please rephrase your question or try a different topic related to Palestine."
+    elif "timeout" in error_message.lower():
+        return "❌ The request timed out. Please try again with a more specific question."
+    else:
+        return f"❌ Error getting response: {error_message}. Please try again or contact support."
+
+
+# Normalize a question so trivially different spellings share one cache entry:
+# case, spacing, punctuation, Arabic diacritics/tatweel and common letter variants
+_ARABIC_MARKS = re.compile(r"[\u0610-\u061A\u064B-\u065F\u0670\u0640]")
+_ARABIC_LETTERS = str.maketrans({"أ": "ا", "إ": "ا", "آ": "ا", "ٱ": "ا", "ى": "ي", "ة": "ه", "ؤ": "و", "ئ": "ي"})
+
+
+def canonical_question(user_question):
+    text = unicodedata.normalize("NFKC", user_question).casefold()
+    text = _ARABIC_MARKS.sub("", text).translate(_ARABIC_LETTERS)
+    text = re.sub(r"[^\w\s]", " ", text)
+    return " ".join(text.split())
+
+
+# Language an answer is written in when none is forced: the language of the question
+def detect_language(user_question):
+    arabic = sum(1 for char in user_question if "\u0600" <= char <= "\u06FF")
+    latin = sum(1 for char in user_question if char.isascii() and char.isalpha())
+    return "ar" if arabic > latin else "en"
+
+
+# Cache key of one answer: its kind, model, prompt version, language and question. `id`
+# ("kind|model|vN|language|canonical question") keys the memory cache, the answer pack
+# and the answer store; the other fields are stored with the answer.
+class AnswerKey:
+    __slots__ = ("kind", "model", "language", "question", "canonical", "id")
+
+    def __init__(self, kind, user_question, model_name, language):
+        self.kind = kind
+        self.model = model_name
+        self.language = language
+        self.question = user_question
+        self.canonical = canonical_question(user_question)
+        self.id = f"{kind}|{model_name}|v{PROMPT_VERSION}|{language}|{self.canonical}"
+
+    def __repr__(self):
+        return f"AnswerKey({self.id!r})"
+
+
+def cache_key(kind, user_question, model_name=MODEL_NAME, language=None):
+    return AnswerKey(kind, user_question, model_name, language or detect_language(user_question))
+
+
+# Memory first, then the memory-mapped answer pack, then the answer store
+# (answers generated since the pack was built)
+def cache_get(key):
+    if not CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if key.id in _answer_cache:
+            _answer_cache.move_to_end(key.id)
+            return _answer_cache[key.id]
+    text = answer_pack.get_answer(key.id)
+    if text is None:
+        text = answer_store.get_answer(key.id)
+    if text is not None:
+        _remember(key.id, text)
+    return text
+
+
+# New answers are also written to the answer store, so the next pack includes them
+def cache_put(key, text):
+    # Error messages are never cached, the next attempt may succeed
+    if not CACHE_ENABLED or text.startswith("❌"):
+        return
+    _remember(key.id, text)
+    # The answer is good whether or not it could be persisted
+    try:
+        answer_store.put_answer(key.id, key.question, key.canonical, key.language, key.kind, key.model,
+                                PROMPT_VERSION, text)
+    except Exception as e:
+        print(f"Answer store write failed for {key.id}: {e}", file=sys.stderr)
+
+
+def _remember(key, text):
+    with _cache_lock:
+        _answer_cache[key] = text
+        _answer_cache.move_to_end(key)
+        while len(_answer_cache) > CACHE_MAX_ENTRIES:
+            _answer_cache.popitem(last=False)
+
+
+# Shared model-call layer: every request to Gemini goes through here
+def generate_text(prompt, model=None, key=None, cancel=None):
+    model = model or model_text
+    if key is not None:
+        cached = cache_get(key)
+        if cached is not None:
+            return cached
+    if cancel is not None and cancel.is_set():
+        return ""
+    try:
+        response = model.generate_content(prompt)
+        text = response.text
+    except Exception as e:
+        return describe_error(e)
+    if key is not None:
+        cache_put(key, text)
+    return text
+
+
+# Streaming variant of generate_text: yields the accumulated text after every chunk
+# and stops early as soon as `cancel` is set
+def stream_text(prompt, model=None, key=None, cancel=None):
+    model = model or model_text
+    if key is not None:
+        cached = cache_get(key)
+        if cached is not None:
+            yield cached
+            return
+    if cancel is not None and cancel.is_set():
+        return
+    text = ""
+    try:
+        for chunk in model.generate_content(prompt, stream=True):
+            if cancel is not None and cancel.is_set():
+                return
+            text += chunk.text
+            yield text
+    except Exception as e:
+        yield describe_error(e)
+        return
+    if key is not None:
+        cache_put(key, text)
+
+
+# Ask Gemini Pro for an in-depth response with improved error handling
+def ask_about_palestine(user_question):
+    return generate_text(build_palestine_prompt(user_question), key=cache_key("answer", user_question))
+
+
+def structured_key(user_question):
+    return cache_key("structured", user_question, STRUCTURED_MODEL_NAME)
+
+
+# Items of the JSON array `key` that are already complete in a partially streamed JSON text.
+# Lets the chat page render each section of a structured answer as soon as it is closed.
+_json_decoder = json.JSONDecoder()
+
+
+def completed_array_items(text, key):
+    match = re.search(r'"%s"\s*:\s*\[' % re.escape(key), text)
+    if not match:
+        return []
+    items = []
+    pos = match.end()
+    while True:
+        while pos < len(text) and text[pos] in " \t\r\n,":
+            pos += 1
+        if pos >= len(text) or text[pos] == "]":
+            return items
+        try:
+            item, pos = _json_decoder.raw_decode(text, pos)
+        except ValueError:
+            return items
+        items.append(item)
+
+
+# Parse a structured answer. Each follow-up question comes with its cache key, so asking
+# it later is a direct cache lookup. Invalid JSON (e.g. an error message) becomes one section.
+def parse_structured_answer(text):
+    try:
+        data = json.loads(text)
+    except ValueError:
+        data = None
+    if not isinstance(data, dict):
+        data = {"title": "", "sections": [{"heading": "", "body": text}], "sources": [], "follow_ups": []}
+    return {
+        "title": data.get("title", ""),
+        "sections": data.get("sections", []),
+        "sources": data.get("sources", []),
+        "follow_ups": [
+            {"question": question, "key": structured_key(question)}
+            for question in data.get("follow_ups", [])
+        ],
+    }
+
+
+# Markdown version of a structured answer
+def structured_to_markdown(data):
+    parts = []
+    if data["title"]:
+        parts.append(f"## {data['title']}")
+    for section in data["sections"]:
+        if section.get("heading"):
+            parts.append(f"### {section['heading']}")
+        parts.append(section.get("body", ""))
+    if data["sources"]:
+        parts.append(sources_to_markdown(data["sources"]))
+    return "\n\n".join(parts)
+
+
+def sources_to_markdown(sources):
+    return "### Sources\n\n" + "\n".join(
+        f"- [{source['name']}]({source['url']})" if source.get("url") else f"- {source['name']}"
+        for source in sources
+    )
+
+
+# Parse the outline returned by the lite model into a list of section titles
+def parse_outline(text):
+    titles = []
+    for line in text.splitlines():
+        title = re.sub(r"^\s*(?:[-*•#]+|\d+[.)])\s*", "", line).strip().strip('"')
+        if title:
+            titles.append(title)
+    return titles[:DEEP_MAX_SECTIONS]
+
+
+# Ask for the outline of a deep answer. Returns [] when deep mode should not be used
+# (off-topic question, API error or an outline too short to be worth splitting).
+def plan_deep_answer(user_question, cancel=None):
+    text = generate_text(build_outline_prompt(user_question), model=model_lite,
+                         key=cache_key("outline", user_question, LITE_MODEL_NAME), cancel=cancel)
+    if text.startswith("❌") or "NOT_PALESTINE" in text:
+        return []
+    titles = parse_outline(text)
+    if len(titles) < DEEP_MIN_SECTIONS:
+        return []
+    return titles
+
+
+# Jobs run on the shared pool. Each one reports back through the events queue.
+def _draft_job(events, user_question, cancel):
+    text = generate_text(build_draft_prompt(user_question), model=model_lite,
+                         key=cache_key("draft", user_question, LITE_MODEL_NAME), cancel=cancel)
+    events.put(("draft", text))
+
+
+def _outline_job(events, user_question, cancel):
+    events.put(("outline", plan_deep_answer(user_question, cancel)))
+
+
+def _section_job(events, user_question, titles, index, cancel):
+    prompt = build_section_prompt(user_question, titles, index)
+    # One entry per section of this exact outline, named by a hash of its titles
+    outline = hashlib.sha256("\n".join(titles).encode("utf-8")).hexdigest()[:16]
+    key = cache_key(f"section{index}-{outline}", user_question)
+    events.put(("section", index, generate_text(prompt, model=model_section, key=key, cancel=cancel)))
+
+
+def _answer_job(events, user_question, cancel):
+    text = ""
+    for text in stream_text(build_palestine_prompt(user_question),
+                            key=cache_key("answer", user_question), cancel=cancel):
+        events.put(("chunk", text))
+    events.put(("answer", text))
+
+
+def _structured_job(events, user_question, cancel):
+    text = ""
+    emitted = 0
+    for text in stream_text(build_structured_prompt(user_question), model=model_structured,
+                            key=structured_key(user_question), cancel=cancel):
+        sections = completed_array_items(text, "sections")
+        for index in range(emitted, len(sections)):
+            events.put(("json_section", index, sections[index]))
+        emitted = len(sections)
+    events.put(("structured", parse_structured_answer(text)))
+
+
+def _run_job(events, job, *args):
+    try:
+        job(events, *args)
+    except Exception as e:
+        events.put(("answer", describe_error(e)))
+
+
+# Answer a question, yielding UI events as soon as they are available:
+#   ("draft", text)           quick lite-model summary (only when draft=True)
+#   ("outline", titles)       deep mode section titles, one slot per title
+#   ("section", index, text)  one finished deep mode section, in completion order
+#   ("chunk", text)           accumulated single-shot answer while it streams
+#   ("json_section", index, section)  one completed section of a structured answer
+#   ("structured", data)      the parsed structured answer (see parse_structured_answer)
+#   ("done", text)            the complete answer, as markdown
+# The draft and the full answer share the cache and the `cancel` event. Closing the
+# generator (e.g. a Streamlit rerun interrupting the loop) cancels pending work.
+# With `brief` (and neither `deep` nor `structured`), the only event is ("done", text): a
+# cached answer if there is one, else a short answer generated in one piece.
+# Pre-generated FAQ answers (faq_batch.py) serve every mode but structured.
+def stream_answer(user_question, deep=False, draft=False, structured=False, cancel=None, brief=False):
+    cancel = cancel or threading.Event()
+    faq = None if structured else cache_get(cache_key("faq", user_question))
+    if faq is not None:
+        yield ("done", faq)
+        return
+    if brief and not deep and not structured:
+        brief_key = cache_key("brief", user_question)
+        text = cache_get(brief_key) or cache_get(cache_key("answer", user_question))
+        if text is None:
+            text = generate_text(build_palestine_prompt(user_question, brief=True), model=model_brief,
+                                 key=brief_key, cancel=cancel)
+        yield ("done", text)
+        return
+    if structured:
+        cached = cache_get(structured_key(user_question))
+        if cached is not None:
+            data = parse_structured_answer(cached)
+            yield ("structured", data)
+            yield ("done", structured_to_markdown(data))
+            return
+    deep_key = cache_key("deep", user_question)
+    cached = cache_get(deep_key) if deep and not structured else None
+    if cached is not None:
+        yield ("done", cached)
+        return
+
+    events = queue.Queue()
+    pending = 0
+
+    def submit(job, *args):
+        nonlocal pending
+        pending += 1
+        _executor.submit(_run_job, events, job, *args)
+
+    if draft:
+        submit(_draft_job, user_question, cancel)
+    if structured:
+        submit(_structured_job, user_question, cancel)
+    elif deep:
+        submit(_outline_job, user_question, cancel)
+    else:
+        submit(_answer_job, user_question, cancel)
+
+    sections = []
+    try:
+        while pending:
+            event = events.get()
+            kind = event[0]
+            if kind not in ("chunk", "json_section"):
+                pending -= 1
+
+            if kind == "outline" and not event[1]:
+                # No usable outline, fall back to the single-shot answer
+                submit(_answer_job, user_question, cancel)
+            elif kind == "outline":
+                sections = [None] * len(event[1])
+                for index in range(len(sections)):
+                    submit(_section_job, user_question, event[1], index, cancel)
+                yield event
+            elif kind == "section":
+                sections[event[1]] = event[2]
+                yield event
+                if all(text is not None for text in sections):
+                    answer = "\n\n".join(sections)
+                    if not any(text.startswith("❌") for text in sections):
+                        cache_put(deep_key, answer)
+                    yield ("done", answer)
+                    return
+            elif kind == "answer":
+                yield ("done", event[1])
+                return
+            elif kind == "structured":
+                yield event
+                yield ("done", structured_to_markdown(event[1]))
+                return
+            else:
+                yield event
+    finally:
+        cancel.set()
+
+
+# Outline-then-parallel-sections answer, joined in outline order.
+# Falls back to a single-shot answer when no usable outline is produced.
+def ask_about_palestine_deep(user_question):
+    for event in stream_answer(user_question, deep=True):
+        if event[0] == "done":
+            return event[1]
+    return ""
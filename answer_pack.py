@@ -0,0 +1,145 @@
+# Read-only, memory-mapped answer pack for instant cache warm-up after a deploy.
+#
+#   python answer_pack.py [--store store/answers.sqlite3] [--out store/answers.pack]
+#
+# packs every answer of the answer store (pre-generated FAQ answers and answers cached
+# by the chat) into one file with an open-addressing hash index. Worker processes map it
+# at startup; the OS shares its pages between them. A new pack is written next to the old
+# one and renamed over it, and readers pick it up on their next check.
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+
+import answer_store
+
+PACK_PATH = os.getenv("ANSWER_PACK_PATH", os.path.join(os.path.dirname(answer_store.STORE_PATH), "answers.pack"))
+# How often readers look for a newer pack on disk, in seconds
+PACK_CHECK_INTERVAL = 5.0
+
+MAGIC = b"PAIPACK1"
+HEADER = struct.Struct("<8sIIQ")  # magic, slot count, entry count, data offset
+SLOT = struct.Struct("<QQI")      # key hash (0 = empty slot), entry offset, entry length
+KEY_LENGTH = struct.Struct("<I")
+
+
+def key_hash(key):
+    digest = int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+    return digest or 1
+
+
+# Write a pack from (key, answer) pairs. The file is built under a temporary name and
+# renamed over `path`, so readers only ever see a complete pack.
+def build_pack(rows, path=PACK_PATH):
+    entries = [(key.encode("utf-8"), answer.encode("utf-8")) for key, answer in rows]
+    slot_count = 8
+    while slot_count < len(entries) * 2:
+        slot_count *= 2
+
+    slots = [(0, 0, 0)] * slot_count
+    data = bytearray()
+    data_offset = HEADER.size + SLOT.size * slot_count
+    for key, answer in entries:
+        entry = KEY_LENGTH.pack(len(key)) + key + answer
+        h = key_hash(key.decode("utf-8"))
+        index = h & (slot_count - 1)
+        while slots[index][0]:
+            index = (index + 1) & (slot_count - 1)
+        slots[index] = (h, data_offset + len(data), len(entry))
+        data += entry
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, slot_count, len(entries), data_offset))
+        for slot in slots:
+            f.write(SLOT.pack(*slot))
+        f.write(data)
+    os.replace(tmp_path, path)
+    return len(entries)
+
+
+def open_pack(path=PACK_PATH):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < HEADER.size:
+            return None
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, slot_count, _, _ = HEADER.unpack_from(mapped, 0)
+    if magic != MAGIC:
+        mapped.close()
+        return None
+    return mapped
+
+
+def pack_lookup(mapped, key):
+    _, slot_count, _, _ = HEADER.unpack_from(mapped, 0)
+    h = key_hash(key)
+    wanted = key.encode("utf-8")
+    index = h & (slot_count - 1)
+    while True:
+        slot_hash, offset, length = SLOT.unpack_from(mapped, HEADER.size + index * SLOT.size)
+        if slot_hash == 0:
+            return None
+        if slot_hash == h:
+            (key_length,) = KEY_LENGTH.unpack_from(mapped, offset)
+            start = offset + KEY_LENGTH.size
+            if mapped[start:start + key_length] == wanted:
+                return mapped[start + key_length:offset + length].decode("utf-8")
+        index = (index + 1) & (slot_count - 1)
+
+
+# The pack currently mapped by this process and the identity of its file
+_pack = None
+_pack_stat = None
+_next_check = 0.0
+_pack_lock = threading.Lock()
+
+
+# Remap the pack when the file on disk was replaced. The old mapping is simply dropped:
+# readers still holding it keep a valid view of the old file until they are done.
+def _refresh(path):
+    global _pack, _pack_stat, _next_check
+    with _pack_lock:
+        _next_check = time.monotonic() + PACK_CHECK_INTERVAL
+        try:
+            stat = os.stat(path)
+        except OSError:
+            _pack, _pack_stat = None, None
+            return
+        identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if identity != _pack_stat:
+            _pack, _pack_stat = open_pack(path), identity
+
+
+# Map the pack at startup so the first requests are already served from it
+def warm_up(path=PACK_PATH):
+    _refresh(path)
+    return _pack is not None
+
+
+def get_answer(key, path=PACK_PATH):
+    if time.monotonic() >= _next_check:
+        _refresh(path)
+    mapped = _pack
+    if mapped is None:
+        return None
+    return pack_lookup(mapped, key)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack the answer store into a memory-mapped file.")
+    parser.add_argument("--store", default=answer_store.STORE_PATH)
+    parser.add_argument("--out", default=PACK_PATH)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    count = build_pack(answer_store.iter_answers(args.store), args.out)
+    print(f"Packed {count} answers into {args.out} ({os.path.getsize(args.out)} bytes) "
+          f"in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import os
+import sqlite3
+import threading
+import time
+
+# Persistent answer store: pre-generated FAQ answers (see faq_batch.py) and answers
+# cached by the chat, with their model/prompt version stamps. Keys are the same strings
+# as the in-process cache keys. answer_pack.py packs it into a memory-mapped file.
+STORE_PATH = os.getenv(
+    "ANSWER_STORE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "store", "answers.sqlite3"),
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    key TEXT PRIMARY KEY,
+    question TEXT NOT NULL,
+    canonical TEXT NOT NULL,
+    language TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    model TEXT NOT NULL,
+    prompt_version INTEGER NOT NULL,
+    answer TEXT NOT NULL,
+    created_at REAL NOT NULL
+)
+"""
+
+_lock = threading.Lock()
+_connections = {}
+
+
+# One connection per store file, shared by every thread (writes are serialized by _lock)
+def _connect(path):
+    connection = _connections.get(path)
+    if connection is None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(_SCHEMA)
+        _connections[path] = connection
+    return connection
+
+
+def get_answer(key, path=STORE_PATH):
+    # A missing store is the normal state before the first batch run
+    if path not in _connections and not os.path.exists(path):
+        return None
+    with _lock:
+        row = _connect(path).execute("SELECT answer FROM answers WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def has_answer(key, path=STORE_PATH):
+    return get_answer(key, path) is not None
+
+
+def put_answer(key, question, canonical, language, kind, model, prompt_version, answer, path=STORE_PATH):
+    with _lock:
+        _connect(path).execute(
+            "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, question, canonical, language, kind, model, prompt_version, answer, time.time()),
+        )
+
+
+def iter_answers(path=STORE_PATH):
+    if not os.path.exists(path):
+        return
+    with _lock:
+        rows = _connect(path).execute("SELECT key, answer FROM answers").fetchall()
+    yield from rows
@@ -0,0 +1,81 @@
+import streamlit as st
+
+from render import CONTENT_LABELS
+from rerun_profile import emit_markdown
+
+# Helpers shared by the app entrypoint (latest-updte.py) and the page scripts in
+# app_pages/. Only the script of the active page runs, so page-specific helpers live in
+# their page script.
+
+
+# Catalog and label language of the session: "en" or "ar"
+def current_language():
+    return 'en' if st.session_state.get("language", "english") == 'english' else 'ar'
+
+
+# Client hints of a slow connection. Browsers send Save-Data whenever the user turned it
+# on; ECT, RTT and Downlink only to sites that ask for them with an Accept-CH header
+# (set by the proxy in front of the app, Streamlit does not send it).
+SLOW_ECT = ("slow-2g", "2g", "3g")
+SLOW_RTT_MS = 500
+SLOW_DOWNLINK_MBPS = 1.0
+
+
+def slow_connection(headers):
+    headers = {name.lower(): value.strip().lower() for name, value in headers.items()}
+    if headers.get("save-data") == "on" or headers.get("ect") in SLOW_ECT:
+        return True
+    try:
+        if float(headers.get("rtt", 0)) > SLOW_RTT_MS:
+            return True
+        return 0 < float(headers.get("downlink", 0)) < SLOW_DOWNLINK_MBPS
+    except ValueError:
+        return False
+
+
+# Low-bandwidth mode of the session: no images or decorative markup, brief answers in
+# one piece, catalog entries sent one at a time. Starts from the client hints of the
+# first request and can be switched in the sidebar.
+def low_bandwidth():
+    if "low_bandwidth" not in st.session_state:
+        st.session_state.low_bandwidth = slow_connection(st.context.headers)
+    return st.session_state.low_bandwidth
+
+
+# Category picker of the catalog pages. Only the selected category is built and sent
+# to the browser; st.tabs would render every category on every rerun and hide all
+# but one in the browser. Options are category IDs, which survive a catalog reload.
+def select_category(categories, language, key):
+    by_id = {category.id: category for category in categories}
+    category_id = st.radio(
+        CONTENT_LABELS[language]["category"],
+        list(by_id),
+        format_func=lambda category_id: by_id[category_id].text("name", language),
+        horizontal=True,
+        key=key,
+    )
+    return by_id.get(category_id, categories[0])
+
+
+# Low-bandwidth listing of a category: a picker of the records' titles, so only the
+# chosen record is sent. None until one is picked.
+def select_record(records, language, label, title_field, key):
+    by_id = {record.id: record for record in records}
+    record_id = st.selectbox(
+        CONTENT_LABELS[language][label],
+        list(by_id),
+        index=None,
+        format_func=lambda record_id: by_id[record_id].text(title_field, language),
+        key=key,
+    )
+    return by_id.get(record_id)
+
+
+# Category title shown at the top of the selected category
+def render_category_title(snapshot, kind, category, language):
+    emit_markdown(snapshot.html[language][(kind, category.id)], unsafe_allow_html=True)
+
+
+# A static section of the pages (page_sections.py), rendered once per catalog version
+def render_page_section(snapshot, name, language):
+    emit_markdown(snapshot.html[language][("page", name)], unsafe_allow_html=True)
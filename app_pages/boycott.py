@@ -0,0 +1,115 @@
+# Boycott page: search, shopping-list checker and the companies of the selected category,
+# from the shared catalog (data/catalog.json). Each part is a fragment that reruns on
+# its own and reads the current snapshot when it runs.
+import streamlit as st
+
+from app_common import (current_language, low_bandwidth, render_category_title, render_page_section,
+                        select_category, select_record)
+from barcodes import lookup_barcode, normalize_barcode
+from catalog import Brand, Company
+from catalog_search import Match
+from catalog_state import current
+from render import CONTENT_LABELS
+from rerun_profile import emit_markdown, tracked_fragment
+from shopping_list import check_shopping_list, read_shopping_list, results_to_csv
+
+
+# Reason, recommended action and alternatives of one boycotted company
+def render_company(snapshot, company, language):
+    emit_markdown(snapshot.html[language][("company", company.id)], unsafe_allow_html=True)
+
+
+# Search results: boycotted companies and brands get the card of the company (or
+# owners) they belong to, names that only appear in a brand list get the list they
+# belong to and its alternatives
+def render_search_results(snapshot, matches, language):
+    labels = CONTENT_LABELS[language]
+    for match in matches:
+        record = match.record
+        if isinstance(record, (Company, Brand)):
+            title = record.text("name", language)
+            if match.name != title:
+                title = f"{title} ({match.name})"
+            emit_markdown(f"#### {title}")
+            owners = snapshot.boycotted_owners(record.id)
+            if not owners:
+                st.info(labels["no_match"])
+            for owner in owners:
+                if owner is not record:
+                    emit_markdown(f"**{labels['owned_by']}** {owner.text('name', language)}")
+                render_company(snapshot, owner, language)
+        else:
+            emit_markdown(f"#### {match.name}")
+            emit_markdown(snapshot.html[language][("brand_list", record.id)], unsafe_allow_html=True)
+
+
+# Whole shopping list at once: pasted lines or an uploaded CSV/text file, checked in
+# one batch and returned as a table that can be downloaded
+@tracked_fragment("shopping_list")
+def render_shopping_list_checker(language):
+    labels = CONTENT_LABELS[language]
+    with st.expander(labels["shopping_list"], expanded=False):
+        pasted = st.text_area(labels["shopping_list_help"], key=f"shopping_list_{language}", height=150)
+        uploaded = st.file_uploader(labels["shopping_list_upload"], type=["csv", "txt"], key=f"shopping_list_file_{language}")
+        if st.button(labels["shopping_list_check"], key=f"shopping_list_check_{language}"):
+            lines = read_shopping_list(pasted)
+            if uploaded is not None:
+                lines += read_shopping_list(uploaded.getvalue(), uploaded.name)
+            if not lines:
+                st.info(labels["shopping_list_empty"])
+                return
+            results = check_shopping_list(lines, language)
+            flagged = sum(1 for result in results if result["status"] != "clear")
+            emit_markdown(f"**{flagged} / {len(results)}** {labels['shopping_list_flagged']}")
+            st.dataframe(results, use_container_width=True)
+            st.download_button(labels["shopping_list_download"], results_to_csv(results),
+                               file_name="shopping-list-check.csv", mime="text/csv")
+
+
+# Instant lookup by name, alias or misspelling, in English or Arabic
+@tracked_fragment("boycott_search")
+def render_boycott_search(language):
+    snapshot = current()
+    catalog = snapshot.catalog
+    labels = CONTENT_LABELS[language]
+
+    query = st.text_input(labels["search"], placeholder=labels["search_placeholder"], key=f"boycott_search_{language}")
+    if query.strip():
+        # A scanned or typed barcode is looked up by its GS1 company prefix
+        record = lookup_barcode(query, catalog) if normalize_barcode(query) else None
+        matches = [Match(record, record.text("name", language), 1.0)] if record else snapshot.search_companies(query)
+        if matches:
+            render_search_results(snapshot, matches, language)
+        else:
+            st.info(labels["no_match"])
+        emit_markdown("---")
+
+
+# Companies of the selected category; switching category only reruns this fragment. In
+# low-bandwidth mode only the company picked from the category is sent.
+@tracked_fragment("boycott_listing")
+def render_boycott_listing(language):
+    snapshot = current()
+    catalog = snapshot.catalog
+    category = select_category(catalog.boycott_categories, language, f"boycott_category_{language}")
+    render_category_title(snapshot, "boycott_category", category, language)
+
+    companies = catalog.companies_by_category[category.id]
+    if low_bandwidth():
+        company = select_record(companies, language, "company", "name", f"boycott_company_{language}")
+        if company is not None:
+            render_company(snapshot, company, language)
+        return
+    for company in companies:
+        with st.expander(company.text("name", language), expanded=False):
+            render_company(snapshot, company, language)
+
+
+language = current_language()
+snapshot = current()
+render_page_section(snapshot, "boycott_intro", language)
+render_boycott_search(language)
+render_shopping_list_checker(language)
+render_boycott_listing(language)
+render_page_section(snapshot, "support_gaza", language)
+render_page_section(snapshot, "bds", language)
@@ -0,0 +1,167 @@
+# Chat page (the home page): the hero, the question box and the streamed answer
+import streamlit as st
+
+from ai_service import sources_to_markdown, stream_answer
+from app_common import current_language, low_bandwidth, render_page_section
+from catalog import Brand, Company
+from catalog_state import current
+from render import CONTENT_LABELS
+from rerun_profile import emit_markdown, section, tracked_fragment
+
+
+# Follow-up buttons only exist during the run that displayed the answer, so the click is
+# handled in a callback that queues the question for the next run
+def ask_follow_up(question):
+    st.session_state.pending_question = question
+
+
+# Render an answer while it is being generated. The single-shot answer streams into one
+# slot; in deep mode every outline section gets its own slot. With `draft`, a quick summary
+# from the lite model is shown first and replaced by the full answer once it is complete.
+# Structured answers render each section as soon as it is complete, then their title (in
+# a slot kept above the sections), sources and suggested follow-up questions, laid out
+# like a cached one. A `brief` answer arrives and renders in one piece.
+def render_answer(user_question, deep=False, draft=False, structured=False, brief=False):
+    draft_slot = st.empty()
+    answer_slot = st.empty()
+    section_slots = []
+    structured_data = None
+
+    with st.spinner("Generating comprehensive answer..."):
+        for event in stream_answer(user_question, deep=deep, draft=draft, structured=structured, brief=brief):
+            kind = event[0]
+            if kind == "draft":
+                draft_slot.info(event[1])
+            elif kind == "outline":
+                with answer_slot.container():
+                    for title in event[1]:
+                        slot = st.empty()
+                        emit_markdown(f"### {title}\n\n*...*", target=slot)
+                        section_slots.append(slot)
+            elif kind == "section":
+                emit_markdown(event[2], target=section_slots[event[1]], unsafe_allow_html=True)
+            elif kind == "json_section":
+                if not section_slots:
+                    section_container = answer_slot.container()
+                    title_slot = section_container.empty()
+                with section_container:
+                    section_slots.append(emit_markdown(f"### {event[2]['heading']}\n\n{event[2]['body']}"))
+            elif kind == "structured":
+                structured_data = event[1]
+                if section_slots and structured_data["title"]:
+                    emit_markdown(f"## {structured_data['title']}", target=title_slot)
+                if section_slots and structured_data["sources"]:
+                    with section_container:
+                        emit_markdown(sources_to_markdown(structured_data["sources"]))
+            elif kind == "chunk":
+                emit_markdown(event[1], target=answer_slot, unsafe_allow_html=True)
+            elif kind == "done" and not section_slots:
+                emit_markdown(event[1], target=answer_slot, unsafe_allow_html=True)
+
+    draft_slot.empty()
+
+    if structured_data and structured_data["follow_ups"]:
+        emit_markdown("#### Follow-up questions")
+        for i, follow_up in enumerate(structured_data["follow_ups"]):
+            st.button(follow_up["question"], key=f"follow_up_{i}",
+                      on_click=ask_follow_up, args=(follow_up["question"],))
+
+
+# Function to check if query is related to Palestine
+def is_palestine_related(query):
+    # List of keywords related to Palestine
+    palestine_keywords = [
+        "palestine", "palestinian", "gaza", "west bank", "jerusalem", "al-quds", 
+        "israel", "israeli", "occupation", "intifada", "nakba", "hamas", "fatah", 
+        "plo", "bds", "boycott", "settlement", "settler", "zionism", "zionist",
+        "al-aqsa", "dome of rock", "hebron", "ramallah", "bethlehem", "nablus",
+        "jenin", "rafah", "khan younis", "unrwa", "refugee", "right of return",
+        "oslo", "two-state", "one-state", "apartheid", "wall", "barrier",
+        "checkpoint", "blockade", "olive", "resistance", "martyr", "shahid",
+        "idf", "arab", "middle east", "levant", "holy land", "balfour",
+        "1948", "1967", "intifada", "uprising", "protest", "demonstration",
+        "solidarity", "human rights", "international law", "un resolution",
+        "occupation", "colonization", "annexation", "displacement", "demolition",
+        "prisoner", "detention", "administrative detention", "hunger strike",
+        "flotilla", "aid", "humanitarian", "ceasefire", "peace process",
+        "negotiation", "mediation", "conflict", "war", "attack", "bombing",
+        "airstrike", "rocket", "tunnel", "border", "crossing", "siege",
+        "sanction", "embargo", "economy", "water", "electricity", "infrastructure",
+        "education", "health", "culture", "heritage", "identity", "diaspora",
+        "return", "citizenship", "stateless", "nationality", "flag", "keffiyeh",
+        "olive tree", "key", "map", "border", "1948", "1967", "partition",
+        "resolution", "un", "unesco", "icj", "icc", "amnesty", "hrw", "btselem",
+        "pchr", "al haq", "adalah", "badil", "passia", "miftah", "pngo",
+        "pflp", "dflp", "jihad", "islamic", "christian", "muslim", "jew",
+        "holy site", "temple mount", "haram al-sharif", "church of nativity",
+        "ibrahimi mosque", "cave of patriarchs", "rachel's tomb", "joseph's tomb",
+        "from the river to the sea", "free palestine", "save palestine"
+    ]
+    
+    query_lower = query.lower()
+    
+    # Check if any of the keywords are in the query
+    for keyword in palestine_keywords:
+        if keyword in query_lower:
+            return True
+    
+    return False
+
+
+# Question box, options and answer of the chat page. Typing, ticking an option, asking
+# and clicking a follow-up only rerun this fragment, not the sidebar and the hero.
+@tracked_fragment("chat")
+def render_chat(language):
+    snapshot = current()
+    user_question = st.text_input("", placeholder="Type your question using your language...",
+                                  key="text_question" if language == 'en' else "text_question_ar")
+
+    # Add a submit button for better UX
+    submit_button = st.button("Get Answer")
+
+    # A follow-up question clicked under the previous answer
+    pending_question = st.session_state.pop("pending_question", None)
+    if pending_question:
+        user_question, submit_button = pending_question, True
+
+    # Low-bandwidth mode always gets a brief answer in one piece, so the options are hidden
+    brief = low_bandwidth()
+    deep_mode = fast_draft = structured_mode = False
+    if not brief:
+        # Long history questions can be split into sections generated in parallel
+        deep_mode = st.checkbox("Deep answer (sections generated in parallel)", key="deep_mode")
+        # A short summary from the fast model appears while the full answer is generated
+        fast_draft = st.checkbox("Show a quick summary first", value=True, key="fast_draft")
+        # JSON answer with sections, cited sources and follow-up questions
+        structured_mode = st.checkbox("Structured answer with sources and follow-up questions", key="structured_mode")
+
+    # Process the question when submitted
+    if user_question and submit_button:
+        # Check if the question is related to Palestine
+        is_palestine = is_palestine_related(user_question)
+
+        # Create a container with better styling for the answer
+        answer_container = st.container()
+        with answer_container:
+            # Companies of the boycott catalog named in the question, straight from the catalog
+            # (brands resolve to the boycotted companies that own them)
+            mentions = {}
+            for match in snapshot.find_mentions(user_question):
+                if isinstance(match.record, (Company, Brand)):
+                    for company in snapshot.boycotted_owners(match.record.id):
+                        mentions.setdefault(company.id, company)
+            if mentions:
+                labels = CONTENT_LABELS[language]
+                st.info(f"{labels['mentioned']} " + ", ".join(
+                    f"**{company.text('name', language)}**: {company.text('action', language)}" for company in mentions.values()))
+            render_answer(user_question, deep=deep_mode, draft=fast_draft,
+                          structured=not brief and (structured_mode or bool(pending_question)), brief=brief)
+
+
+language = current_language()
+snapshot = current()
+if not low_bandwidth():
+    with section("hero"):
+        render_page_section(snapshot, "hero", language)
+render_page_section(snapshot, "chat_intro", language)
+render_chat(language)
@@ -0,0 +1,35 @@
+# Education page: the educational resources of the selected category
+import streamlit as st
+
+from app_common import (current_language, low_bandwidth, render_category_title, render_page_section,
+                        select_category, select_record)
+from catalog_state import current
+from rerun_profile import emit_markdown, tracked_fragment
+
+
+# Educational resources of the selected category, one pre-rendered block each;
+# resources missing in `language` are skipped. Switching category only reruns this
+# fragment. In low-bandwidth mode only the resource picked from the category is sent.
+@tracked_fragment("education_listing")
+def render_education_listing(language):
+    snapshot = current()
+    catalog = snapshot.catalog
+    category = select_category(catalog.education_categories, language, f"education_category_{language}")
+    render_category_title(snapshot, "education_category", category, language)
+
+    resources = catalog.resources_in(category.id, language)
+    if low_bandwidth():
+        resource = select_record(resources, language, "resource", "title", f"education_resource_{language}")
+        if resource is not None:
+            emit_markdown(snapshot.html[language][("resource", resource.id)], unsafe_allow_html=True)
+        return
+    for resource in resources:
+        with st.expander(resource.text("title", language), expanded=False):
+            emit_markdown(snapshot.html[language][("resource", resource.id)], unsafe_allow_html=True)
+
+
+language = current_language()
+snapshot = current()
+render_page_section(snapshot, "education_intro", language)
+render_education_listing(language)
+render_page_section(snapshot, "reading", language)
@@ -0,0 +1,35 @@
+import hashlib
+import os
+
+# Static files of the app. Streamlit serves static/ at app/static/ (server.enableStaticServing
+# in .streamlit/config.toml), so pages load them from the app itself instead of a third-party
+# host. URLs carry a hash of the file's content: a changed file gets a new URL, and an
+# unchanged one can be cached by the browser and any proxy in front of the app for as long
+# as they like.
+# Streamlit only sends a real Content-Type for .png, .jpg/.jpeg, .gif, .webp and .pdf;
+# anything else goes out as text/plain with nosniff, which browsers will not display as
+# an image (SVG included), so images served to the app must be in one of those formats.
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+STATIC_URL = "app/static"
+
+# name -> (file identity, URL); a file is hashed again only when it changed on disk
+_urls = {}
+
+
+def asset_url(name):
+    path = os.path.join(STATIC_DIR, name)
+    stat = os.stat(path)
+    identity = (stat.st_mtime_ns, stat.st_size)
+    cached = _urls.get(name)
+    if cached is None or cached[0] != identity:
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()[:12]
+        cached = (identity, f"{STATIC_URL}/{name}?v={digest}")
+        _urls[name] = cached
+    return cached[1]
+
+
+# <img> of a static file at its display size
+def asset_img(name, width, alt):
+    return f'<img src="{asset_url(name)}" width="{width}" alt="{alt}">'
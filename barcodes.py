@@ -0,0 +1,108 @@
+import csv
+import os
+import threading
+from array import array
+from bisect import bisect_right
+
+from catalog import compact
+from catalog_state import current
+
+# Barcode -> company lookup from a local table of GS1 company prefixes (CSV with the
+# columns prefix, owner, note; owner is a company or brand ID of the catalog). Prefixes
+# are stored in GTIN-13 form (a UPC-A prefix gets a leading 0). They have different
+# lengths, so each one is turned into the range of 13-digit codes it covers, and the
+# sorted range starts are kept in a compact array searched with bisect.
+GS1_PREFIX_PATH = os.getenv(
+    "GS1_PREFIX_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "gs1_prefixes.csv"),
+)
+
+GTIN_LENGTH = 13
+
+
+# GTIN-8/12/13/14 digits -> 13 digits, or None if it is not a valid barcode
+def normalize_barcode(code):
+    digits = "".join(char for char in str(code) if not char.isspace() and char != "-")
+    if not digits.isdigit() or len(digits) not in (8, 12, 13, 14):
+        return None
+    # The last digit is a check digit over the others, weighted 3,1,3,... from the right
+    body, check = digits[:-1], int(digits[-1])
+    total = sum(int(char) * (3 if i % 2 == 0 else 1) for i, char in enumerate(reversed(body)))
+    if (10 - total % 10) % 10 != check:
+        return None
+    if len(digits) == 14:
+        # GTIN-14 (cases and pallets): the leading packaging indicator is not part of the prefix
+        digits = digits[1:]
+    return digits.zfill(GTIN_LENGTH)
+
+
+class PrefixTable:
+    def __init__(self, rows):
+        ranges = []
+        for prefix, owner in rows:
+            if not prefix.isdigit() or not 1 <= len(prefix) < GTIN_LENGTH:
+                raise ValueError(f"invalid GS1 prefix {prefix!r}")
+            scale = 10 ** (GTIN_LENGTH - len(prefix))
+            ranges.append((int(prefix) * scale, (int(prefix) + 1) * scale, compact(owner)))
+        ranges.sort()
+        for (_, end, owner), (start, _, other) in zip(ranges, ranges[1:]):
+            if start < end:
+                raise ValueError(f"overlapping GS1 prefixes for {owner!r} and {other!r}")
+
+        self.starts = array("Q", (start for start, _, _ in ranges))
+        self.ends = array("Q", (end for _, end, _ in ranges))
+        # Owner IDs by position; the same owner appears under several prefixes
+        self.owners = tuple(owner for _, _, owner in ranges)
+
+    def __len__(self):
+        return len(self.starts)
+
+    # Owner ID of a normalized 13-digit code, or None
+    def owner_of(self, gtin):
+        number = int(gtin)
+        position = bisect_right(self.starts, number) - 1
+        if position >= 0 and number < self.ends[position]:
+            return self.owners[position]
+        return None
+
+
+
+def read_prefix_table(path=GS1_PREFIX_PATH):
+    with open(path, encoding="utf-8", newline="") as f:
+        return PrefixTable((row["prefix"].strip(), row["owner"].strip()) for row in csv.DictReader(f))
+
+
+_table = None
+_table_stat = None
+_table_lock = threading.Lock()
+
+
+# The shared prefix table, re-read only when the file changed on disk. A missing file
+# means barcode lookup is not configured.
+def load_prefix_table(path=GS1_PREFIX_PATH):
+    global _table, _table_stat
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    identity = (stat.st_mtime_ns, stat.st_size)
+    if _table is not None and identity == _table_stat:
+        return _table
+    with _table_lock:
+        if _table is None or identity != _table_stat:
+            _table = read_prefix_table(path)
+            _table_stat = identity
+    return _table
+
+
+# Catalog record (company or brand) owning the GS1 prefix of a barcode, or None
+def lookup_barcode(ean, catalog=None):
+    gtin = normalize_barcode(ean)
+    table = load_prefix_table()
+    if gtin is None or table is None:
+        return None
+    owner = table.owner_of(gtin)
+    if owner is None:
+        return None
+    catalog = catalog or current().catalog
+    return catalog.companies_by_id.get(owner) or catalog.brands_by_id.get(owner)
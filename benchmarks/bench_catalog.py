@@ -0,0 +1,55 @@
+# Per-rerun CPU time and allocations of the boycott/education data.
+#   before: the data is rebuilt from nested dict literals on every call (the old
+#           get_boycott_data_* / get_educational_resources_* functions)
+#   after:  catalog_state.current() returns the shared, already validated catalog
+# Run from the repository root: python benchmarks/bench_catalog.py
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog import CATALOG_PATH
+from catalog_state import current
+
+RUNS = 2000
+
+with open(CATALOG_PATH, encoding="utf-8") as f:
+    data = json.load(f)
+
+# The same nested literals the old functions contained, compiled once like a module is
+literals = {
+    name: compile(repr(data[name]), name, "eval")
+    for name in ("boycott", "education", "brand_lists")
+}
+
+
+def rerun_before():
+    return [eval(code) for code in literals.values()]
+
+
+def rerun_after():
+    catalog = current().catalog
+    return [catalog.companies_by_category, catalog.resources_by_category, catalog.brand_lists]
+
+
+def measure(fn):
+    fn()
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        fn()
+    elapsed = (time.perf_counter() - start) / RUNS
+
+    tracemalloc.start()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, peak
+
+
+for label, fn in (("before (rebuild literals)", rerun_before), ("after (shared catalog)", rerun_after)):
+    elapsed, peak = measure(fn)
+    print(f"{label:<28} {elapsed * 1e6:>10.1f} us/rerun {peak / 1024:>10.1f} KiB allocated/rerun")
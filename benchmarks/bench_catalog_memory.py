@@ -0,0 +1,53 @@
+# Per-process memory footprint of the content catalog as it grows.
+# The real catalog is cloned into synthetic catalogs of N companies/resources and measured
+# with tracemalloc, as parsed JSON dicts (the old representation) and as slotted,
+# interned Catalog records with a shared source table.
+# Run from the repository root: python benchmarks/bench_catalog_memory.py
+import copy
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog import CATALOG_PATH, Catalog
+
+SIZES = (100, 1000, 5000)
+
+with open(CATALOG_PATH, encoding="utf-8") as f:
+    base = json.load(f)
+
+
+def synthetic_catalog(size):
+    data = copy.deepcopy(base)
+    companies = base["boycott"]["companies"]
+    resources = base["education"]["resources"]
+    data["boycott"]["companies"] = [
+        dict(companies[i % len(companies)], id=f"company-{i}") for i in range(size)
+    ]
+    data["education"]["resources"] = [
+        dict(resources[i % len(resources)], id=f"resource-{i}") for i in range(size)
+    ]
+    # Serialize so every string is a fresh object when parsed, as when reading the file
+    return json.dumps(data, ensure_ascii=False)
+
+
+def footprint(build, text):
+    gc.collect()
+    tracemalloc.start()
+    result = build(text)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+print(f"{'records':>8} {'dicts KiB':>11} {'records KiB':>12} {'dicts B/rec':>12} {'records B/rec':>14}")
+for size in SIZES:
+    text = synthetic_catalog(size)
+    as_dicts = footprint(json.loads, text)
+    as_records = footprint(lambda raw: Catalog(json.loads(raw)), text)
+    print(f"{size:>8} {as_dicts / 1024:>11.0f} {as_records / 1024:>12.0f} "
+          f"{as_dicts / (2 * size):>12.0f} {as_records / (2 * size):>14.0f}")
@@ -0,0 +1,51 @@
+# Compare single-shot answers with outline-then-parallel-sections (deep mode) answers.
+# Needs GOOGLE_API_KEY. Run from the repository root:
+#   python benchmarks/bench_deep_answer.py [questions.txt]
+# Every answer cache is off, so both modes call the model for every question.
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["ANSWER_CACHE"] = "0"
+
+from ai_service import ask_about_palestine, ask_about_palestine_deep
+
+DEFAULT_QUESTIONS = [
+    "Give me the deep history of Palestine from the Ottoman period to the Nakba.",
+    "Explain the history of the Gaza Strip since 1948 in detail.",
+    "What happened during the First and Second Intifadas and what were their consequences?",
+    "اشرح تاريخ القدس منذ عام 1917 حتى اليوم بالتفصيل",
+]
+
+
+def load_questions(path):
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def timed(fn, question):
+    start = time.perf_counter()
+    answer = fn(question)
+    return time.perf_counter() - start, answer
+
+
+def main():
+    questions = load_questions(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_QUESTIONS
+    totals = {"single": 0.0, "deep": 0.0}
+
+    print(f"{'question':<50} {'single s':>9} {'deep s':>9} {'speedup':>8} {'chars single/deep':>18}")
+    for question in questions:
+        single_time, single_answer = timed(ask_about_palestine, question)
+        deep_time, deep_answer = timed(ask_about_palestine_deep, question)
+        totals["single"] += single_time
+        totals["deep"] += deep_time
+        print(f"{question[:50]:<50} {single_time:>9.1f} {deep_time:>9.1f} "
+              f"{single_time / deep_time:>7.2f}x {len(single_answer):>8}/{len(deep_answer):<9}")
+
+    print(f"{'TOTAL':<50} {totals['single']:>9.1f} {totals['deep']:>9.1f} "
+          f"{totals['single'] / totals['deep']:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# Bytes sent to the browser per page view of the chat, boycott and education pages, in
+# English and Arabic, normal and low-bandwidth mode: the serialized size of every element
+# the app script emits (what the ForwardMsg deltas carry), measured with Streamlit's app
+# testing harness.
+# Run from the repository root on two commits to compare them:
+#   python benchmarks/bench_page_bytes.py
+# The catalog pages count their first category, expanders included (Streamlit sends
+# the body of a collapsed expander too).
+import os
+import sys
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+APP = os.path.join(ROOT, "latest-updte.py")
+
+PAGES = {
+    "chat": "app_pages/chat.py",
+    "boycott": "app_pages/boycott.py",
+    "education": "app_pages/education.py",
+}
+
+
+def tree_bytes(node):
+    proto = getattr(node, "proto", None)
+    size = proto.ByteSize() if proto is not None else 0
+    for child in getattr(node, "children", {}).values():
+        size += tree_bytes(child)
+    return size
+
+
+def page_bytes(page, language, low_bandwidth):
+    app = AppTest.from_file(APP, default_timeout=30)
+    app.session_state["language"] = language
+    app.session_state["low_bandwidth"] = low_bandwidth
+    app.switch_page(PAGES[page])
+    app.run()
+    return tree_bytes(app.main), tree_bytes(app.sidebar)
+
+
+print(f"{'page':<12}{'language':<10}{'mode':<8}{'main':>10}{'sidebar':>10}{'total':>10}")
+for page in PAGES:
+    for language in ("english", "arabic"):
+        for mode, low_bandwidth in (("normal", False), ("low", True)):
+            main, sidebar = page_bytes(page, language, low_bandwidth)
+            print(f"{page:<12}{language:<10}{mode:<8}{main:>10}{sidebar:>10}{main + sidebar:>10}")
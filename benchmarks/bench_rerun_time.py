@@ -0,0 +1,47 @@
+# Script time per rerun of the chat, boycott and education pages, in English and
+# Arabic, normal and low-bandwidth mode: the median wall time of AppTest.run() on a warm
+# app (catalog loaded, modules imported), so it is the cost of executing the page script
+# and serializing what it emits. Run from the repository root on two commits to compare
+# them:
+#   python benchmarks/bench_rerun_time.py
+import os
+import statistics
+import sys
+import time
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+APP = os.path.join(ROOT, "latest-updte.py")
+
+RUNS = 30
+
+PAGES = {
+    "chat": "app_pages/chat.py",
+    "boycott": "app_pages/boycott.py",
+    "education": "app_pages/education.py",
+}
+
+
+def rerun_times(page, language, low_bandwidth):
+    app = AppTest.from_file(APP, default_timeout=30)
+    app.session_state["language"] = language
+    app.session_state["low_bandwidth"] = low_bandwidth
+    app.switch_page(PAGES[page])
+    app.run()
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        app.run()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+print(f"{'page':<12}{'language':<10}{'mode':<8}{'median ms':>12}{'p90 ms':>10}")
+for page in PAGES:
+    for language in ("english", "arabic"):
+        for mode, low_bandwidth in (("normal", False), ("low", True)):
+            times = sorted(rerun_times(page, language, low_bandwidth))
+            print(f"{page:<12}{language:<10}{mode:<8}{statistics.median(times) * 1e3:>12.2f}"
+                  f"{times[int(len(times) * 0.9)] * 1e3:>10.2f}")
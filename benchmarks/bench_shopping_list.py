@@ -0,0 +1,70 @@
+# Throughput of the bulk shopping-list checker on a synthetic 10k-line list: product
+# lines built from catalog names, aliases, misspellings and unrelated groceries. The
+# groceries should all check out as "clear"; any that do not are listed (false positives).
+# Run from the repository root: python benchmarks/bench_shopping_list.py
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog_state import current
+from shopping_list import check_shopping_list
+
+LINES = 10_000
+GROCERIES = ["tomatoes", "olive oil 1L", "bread", "milk 2%", "rice 5kg", "dates", "lentils",
+             "chicken breast", "za'atar", "apples", "لبن", "خبز", "زيت زيتون", "washing powder"]
+SUFFIXES = ["", " 330ml", " x6", " family pack", " original", " 200g", " zero"]
+
+
+def misspell(name, rng):
+    if len(name) < 5:
+        return name
+    i = rng.randrange(1, len(name) - 1)
+    return name[:i] + name[i + 1:]
+
+
+def synthetic_list(size, seed=0):
+    rng = random.Random(seed)
+    names = [entry[1] for entry in current().search.entries]
+    lines = []
+    for i in range(size):
+        roll = rng.random()
+        if roll < 0.4:
+            line = rng.choice(GROCERIES)
+        elif roll < 0.85:
+            line = rng.choice(names) + rng.choice(SUFFIXES)
+        else:
+            line = misspell(rng.choice(names), rng) + rng.choice(SUFFIXES)
+        # Real lists have quantities in front, which also makes most lines distinct
+        lines.append(f"{i % 7 + 1}x {line}")
+    return lines
+
+
+def main():
+    lines = synthetic_list(LINES)
+    # Build the index and ownership closure outside the measurement
+    check_shopping_list(lines[:1])
+
+    runs = []
+    for _ in range(5):
+        start = time.perf_counter()
+        results = check_shopping_list(lines)
+        runs.append(time.perf_counter() - start)
+    best = min(runs)
+    counts = {}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+
+    print(f"{LINES} lines, {len(set(lines))} distinct: best {best * 1000:.1f} ms "
+          f"({LINES / best:,.0f} lines/s), median {sorted(runs)[2] * 1000:.1f} ms")
+    print("  " + ", ".join(f"{status}: {count}" for status, count in sorted(counts.items())))
+    flagged = [result for result in check_shopping_list(GROCERIES) if result["status"] != "clear"]
+    print(f"  groceries not clear: {len(flagged)}/{len(GROCERIES)}")
+    for result in flagged:
+        print(f"    {result['line']}: {result['status']} ({result['match']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+import json
+import os
+import re
+import sys
+
+# Boycott and educational content, read from a versioned data bundle and shared
+# read-only by every session (see catalog_state.py)
+CATALOG_PATH = os.getenv(
+    "CATALOG_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "catalog.json"),
+)
+
+# Languages of the catalog; per-language fields are tuples in this order
+LANGUAGES = ("en", "ar")
+_LANGUAGE_INDEX = {language: index for index, language in enumerate(LANGUAGES)}
+
+# Category names, source names, URLs and alternatives repeat across records;
+# interning keeps a single copy of each string per process
+def compact(value):
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(compact(item) for item in value)
+    return value
+
+
+# {"en": x, "ar": y} -> (x, y) in LANGUAGES order, None for a missing language
+def per_language(value):
+    value = value or {}
+    return tuple(compact(value[language]) if language in value else None for language in LANGUAGES)
+
+
+# One frozen, slotted record type per kind of content. Every language lives in the same
+# record, so both languages render from one structure through one code path.
+class Record:
+    __slots__ = ()
+    localized_fields = ()
+
+    def __init__(self, data):
+        for field in self.__slots__:
+            value = data.get(field)
+            value = per_language(value) if field in self.localized_fields else compact(value)
+            object.__setattr__(self, field, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} records are read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} records are read-only")
+
+    # Pickling (see catalog_compiler.py) goes around the read-only __setattr__
+    def __getstate__(self):
+        return tuple(getattr(self, field) for field in self.__slots__)
+
+    def __setstate__(self, state):
+        for field, value in zip(self.__slots__, state):
+            object.__setattr__(self, field, value)
+
+    # Value of a per-language field; missing languages fall back to English
+    def text(self, field, language):
+        values = getattr(self, field)
+        value = values[_LANGUAGE_INDEX[language]] if language in _LANGUAGE_INDEX else None
+        return values[0] if value is None else value
+
+    def has_language(self, language):
+        index = _LANGUAGE_INDEX.get(language)
+        return index is not None and all(getattr(self, field)[index] is not None
+                                         for field in self.localized_fields)
+
+
+class Category(Record):
+    __slots__ = ("id", "name")
+    localized_fields = ("name",)
+
+
+# `aliases` are other spellings and scripts of the name, used by catalog_search.py;
+# `owners` are the IDs of parent companies or brands (see ownership.py).
+# `ambiguous_names` are names or aliases that are also common words ("Apple", "Sabra"):
+# in free text they only name the record next to one of its `context` words ("hummus")
+# or a shopping/boycott word (catalog_search.MENTION_CONTEXT).
+class Company(Record):
+    __slots__ = ("id", "category", "name", "aliases", "ambiguous_names", "context", "owners",
+                 "reason", "action", "alternatives")
+    localized_fields = ("name", "reason", "action", "alternatives")
+
+
+# A product brand or group that is not itself on the boycott list, only linked to the
+# companies that own it
+class Brand(Record):
+    __slots__ = ("id", "name", "aliases", "ambiguous_names", "context", "owners")
+    localized_fields = ("name",)
+
+
+# `sources` holds indexes into the shared Catalog.sources table
+class Resource(Record):
+    __slots__ = ("id", "category", "title", "description", "key_facts", "sources")
+    localized_fields = ("title", "description", "key_facts", "sources")
+
+
+class BrandList(Record):
+    __slots__ = ("id", "name", "companies", "alternatives")
+    localized_fields = ("name", "alternatives")
+
+
+class Source(Record):
+    __slots__ = ("name", "url")
+
+
+# Records plus their indexes by ID and by category
+class Catalog:
+    def __init__(self, data):
+        self.version = data["version"]
+        self.languages = tuple(data["languages"])
+
+        self.boycott_categories = tuple(Category(item) for item in data["boycott"]["categories"])
+        self.companies = tuple(Company(item) for item in data["boycott"]["companies"])
+        self.education_categories = tuple(Category(item) for item in data["education"]["categories"])
+        self.brand_lists = tuple(BrandList(item) for item in data["brand_lists"])
+        self.brands = tuple(Brand(item) for item in data.get("brands", []))
+
+        # Every distinct source is stored once; resources refer to it by index
+        sources = []
+        source_index = {}
+
+        def source_id(source):
+            key = (source["name"], source.get("url", ""))
+            if key not in source_index:
+                source_index[key] = len(sources)
+                sources.append(Source({"name": key[0], "url": key[1]}))
+            return source_index[key]
+
+        self.resources = tuple(
+            Resource(dict(item, sources={
+                language: [source_id(source) for source in items]
+                for language, items in item["sources"].items()
+            }))
+            for item in data["education"]["resources"]
+        )
+        self.sources = tuple(sources)
+
+        self.companies_by_id = {company.id: company for company in self.companies}
+        self.resources_by_id = {resource.id: resource for resource in self.resources}
+        self.brands_by_id = {brand.id: brand for brand in self.brands}
+        self.brand_lists_by_id = {brand_list.id: brand_list for brand_list in self.brand_lists}
+        self.companies_by_category = group_by_category(self.boycott_categories, self.companies)
+        self.resources_by_category = group_by_category(self.education_categories, self.resources)
+
+    def sources_of(self, resource, language):
+        return tuple(self.sources[index] for index in resource.text("sources", language))
+
+    # Education resources of one category that exist in `language`
+    def resources_in(self, category_id, language):
+        return tuple(resource for resource in self.resources_by_category[category_id]
+                     if resource.has_language(language))
+
+
+def group_by_category(categories, records):
+    groups = {category.id: [] for category in categories}
+    for record in records:
+        groups[record.category].append(record)
+    return {category_id: tuple(items) for category_id, items in groups.items()}
+
+
+# Void elements never have a closing tag
+_VOID_TAGS = {"br", "hr", "img", "wbr"}
+_TAG = re.compile(r"<(/?)([a-zA-Z][a-zA-Z0-9]*)[^<>]*?(/?)>")
+
+
+# Unbalanced tags in text that is inserted into the pages as HTML. Text may be a list
+# (key facts, alternatives) or a source dict.
+def html_problems(value):
+    if isinstance(value, list):
+        return [problem for item in value for problem in html_problems(item)]
+    if isinstance(value, dict):
+        return [problem for item in value.values() for problem in html_problems(item)]
+    if not isinstance(value, str) or "<" not in value:
+        return []
+    problems = []
+    open_tags = []
+    for closing, tag, self_closing in _TAG.findall(value):
+        tag = tag.lower()
+        if tag in _VOID_TAGS or self_closing:
+            continue
+        if not closing:
+            open_tags.append(tag)
+        elif open_tags and open_tags[-1] == tag:
+            open_tags.pop()
+        else:
+            problems.append(f"unexpected </{tag}>")
+    problems.extend(f"unclosed <{tag}>" for tag in open_tags)
+    stray = _TAG.sub("", value)
+    if "<" in stray and re.search(r"<[a-zA-Z/]", stray):
+        problems.append("malformed tag")
+    return problems
+
+
+# Check the structure the pages rely on, so a bad edit fails at load time instead of
+# in the middle of a user's page
+def validate_catalog(data):
+    errors = []
+    if not isinstance(data.get("version"), int):
+        errors.append("version must be an integer")
+    languages = data.get("languages", [])
+    if tuple(languages) != LANGUAGES:
+        errors.append(f"languages must be {list(LANGUAGES)}")
+
+    def check_records(section, records, record_type, category_ids, all_languages):
+        seen = set()
+        for item in records:
+            record_id = item.get("id")
+            if not record_id:
+                errors.append(f"{section}: record without id")
+            elif record_id in seen:
+                errors.append(f"{section}/{record_id}: duplicate id")
+            seen.add(record_id)
+            # Misspelled fields ("key_facts1") would otherwise be silently ignored
+            for field in item:
+                if field not in record_type.__slots__:
+                    errors.append(f"{section}/{record_id}: unknown field {field!r}")
+            if category_ids is not None and item.get("category") not in category_ids:
+                errors.append(f"{section}/{record_id}: unknown category {item.get('category')!r}")
+            for field in record_type.localized_fields:
+                value = item.get(field)
+                if not isinstance(value, dict) or not value:
+                    errors.append(f"{section}/{record_id}: missing {field}")
+                else:
+                    if all_languages:
+                        for language in languages:
+                            if language not in value:
+                                errors.append(f"{section}/{record_id}: missing {field} in {language}")
+                    for language, text in value.items():
+                        for problem in html_problems(text):
+                            errors.append(f"{section}/{record_id}: {field} in {language}: {problem}")
+        return seen
+
+    boycott = data.get("boycott", {})
+    education = data.get("education", {})
+    boycott_categories = check_records("boycott/categories", boycott.get("categories", []), Category, None, True)
+    check_records("boycott/companies", boycott.get("companies", []), Company, boycott_categories, True)
+    brands = check_records("brands", data.get("brands", []), Brand, None, False)
+    for record_id in brands & {item.get("id") for item in boycott.get("companies", [])}:
+        errors.append(f"brands/{record_id}: also a company id")
+
+    # Owners may be companies or brands
+    owner_ids = brands | {item.get("id") for item in boycott.get("companies", [])}
+    for section, records in (("boycott/companies", boycott.get("companies", [])), ("brands", data.get("brands", []))):
+        for item in records:
+            for field in ("aliases", "ambiguous_names", "context"):
+                values = item.get(field, [])
+                if not isinstance(values, list) or not all(isinstance(value, str) and value for value in values):
+                    errors.append(f"{section}/{item.get('id')}: {field} must be a list of names")
+            names = set(item.get("aliases", [])) if isinstance(item.get("aliases", []), list) else set()
+            if isinstance(item.get("name"), dict):
+                names.update(item["name"].values())
+            for name in item.get("ambiguous_names", []):
+                if name not in names:
+                    errors.append(f"{section}/{item.get('id')}: ambiguous name {name!r} is not a name or alias")
+            for owner in item.get("owners", []):
+                if owner not in owner_ids or owner == item.get("id"):
+                    errors.append(f"{section}/{item.get('id')}: unknown owner {owner!r}")
+    education_categories = check_records("education/categories", education.get("categories", []), Category, None, True)
+    # Some resources only exist in one language
+    check_records("education/resources", education.get("resources", []), Resource, education_categories, False)
+    check_records("brand_lists", data.get("brand_lists", []), BrandList, None, False)
+
+    if errors:
+        raise ValueError("Invalid catalog:\n" + "\n".join(errors))
+
+
+# Read and validate a catalog file. Sessions get the shared catalog and its derived
+# indexes from catalog_state.current().
+def read_catalog(path=CATALOG_PATH):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    validate_catalog(data)
+    return Catalog(data)
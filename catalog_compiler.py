@@ -0,0 +1,232 @@
+# Catalog compiler: validate the source catalog and write everything derived from it
+# into one artifact, so app startup maps a file instead of recomputing.
+#
+#   python catalog_compiler.py [--source data/catalog.json] [--out build/catalog.artifact] [--strict]
+#
+# The source is checked (schema, unknown fields, unbalanced HTML, EN/AR parity) before
+# anything is written; parity differences are warnings unless --strict. The artifact
+# holds the normalized records, the search index, the ownership closure and the
+# pre-rendered fragments of every language, each as a separate section with its SHA-256,
+# plus the SHA-256 of the source it was compiled from and of the code that compiled it.
+# catalog_state.py only uses an artifact compiled from the current source file by the
+# current code, and builds in-process otherwise.
+import argparse
+import hashlib
+import io
+import json
+import mmap
+import os
+import pickle
+import struct
+import sys
+import time
+
+from catalog import CATALOG_PATH, Brand, BrandList, Catalog, Company, Resource, validate_catalog
+from catalog_search import SearchIndex
+from ownership import build_ownership
+from render import render_catalog
+
+ARTIFACT_PATH = os.getenv(
+    "CATALOG_ARTIFACT_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "build", "catalog.artifact"),
+)
+
+MAGIC = b"PAICAT01"
+HEADER_LENGTH = struct.Struct("<I")
+# Bumped whenever the layout of the file changes
+FORMAT_VERSION = 1
+SECTIONS = ("catalog", "search", "ownership", "html")
+# Modules whose code shapes the sections; an artifact built by other code is stale
+CODE_MODULES = ("catalog.py", "catalog_search.py", "ownership.py", "render.py", "page_sections.py",
+                "catalog_compiler.py")
+
+
+def code_sha256():
+    digest = hashlib.sha256()
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for name in CODE_MODULES:
+        with open(os.path.join(directory, name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+CODE_SHA256 = code_sha256()
+
+# Sections after "catalog" refer to its records by kind and ID instead of copying them,
+# so a loaded snapshot shares one object per record like a freshly built one
+_RECORD_KINDS = {Company: "company", Brand: "brand", BrandList: "brand_list", Resource: "resource"}
+
+
+# Everything derived from a catalog, by section name
+def build_sections(catalog, previous_ownership=None):
+    return {
+        "catalog": catalog,
+        "search": SearchIndex(catalog),
+        "ownership": build_ownership(catalog, previous_ownership),
+        "html": render_catalog(catalog),
+    }
+
+
+def sha256_of(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+# Differences between the languages of records that exist in both. Some are legitimate
+# (an Arabic resource citing more Arabic sources), so they are warnings by default.
+def parity_warnings(data):
+    warnings = []
+    sections = (
+        ("boycott/companies", data["boycott"]["companies"]),
+        ("education/resources", data["education"]["resources"]),
+        ("brands", data.get("brands", [])),
+    )
+    for section, records in sections:
+        for item in records:
+            # Languages the record exists in: every language of any of its fields
+            languages = set()
+            for value in item.values():
+                if isinstance(value, dict):
+                    languages |= set(value)
+            for field, value in item.items():
+                if not isinstance(value, dict):
+                    continue
+                if set(value) != languages:
+                    warnings.append(f"{section}/{item['id']}: {field} missing in {sorted(languages - set(value))}")
+                lengths = {language: len(text) for language, text in value.items() if isinstance(text, list)}
+                if len(set(lengths.values())) > 1:
+                    counts = ", ".join(f"{language}={count}" for language, count in lengths.items())
+                    warnings.append(f"{section}/{item['id']}: {field} has different lengths ({counts})")
+    return warnings
+
+
+class _SectionPickler(pickle.Pickler):
+    def persistent_id(self, obj):
+        kind = _RECORD_KINDS.get(type(obj))
+        return (kind, obj.id) if kind else None
+
+
+class _SectionUnpickler(pickle.Unpickler):
+    def __init__(self, data, catalog):
+        super().__init__(data)
+        self.records = {
+            "company": catalog.companies_by_id,
+            "brand": catalog.brands_by_id,
+            "brand_list": catalog.brand_lists_by_id,
+            "resource": catalog.resources_by_id,
+        }
+
+    def persistent_load(self, pid):
+        kind, record_id = pid
+        return self.records[kind][record_id]
+
+
+def _dump_section(name, value):
+    if name == "catalog":
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    output = io.BytesIO()
+    _SectionPickler(output, protocol=pickle.HIGHEST_PROTOCOL).dump(value)
+    return output.getvalue()
+
+
+# Write the artifact under a temporary name and rename it over `path`, so readers only
+# ever see a complete file
+def write_artifact(sections, source_sha256, path=ARTIFACT_PATH):
+    payloads = {name: _dump_section(name, sections[name]) for name in SECTIONS}
+    entries = {}
+    offset = 0
+    for name in SECTIONS:
+        entries[name] = {"offset": offset, "length": len(payloads[name]), "sha256": sha256_of(payloads[name])}
+        offset += len(payloads[name])
+    header = json.dumps({
+        "format": FORMAT_VERSION,
+        "python": list(sys.version_info[:2]),
+        "code_sha256": CODE_SHA256,
+        "version": sections["catalog"].version,
+        "source_sha256": source_sha256,
+        "sections": entries,
+    }).encode("utf-8")
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC + HEADER_LENGTH.pack(len(header)) + header)
+        for name in SECTIONS:
+            f.write(payloads[name])
+    os.replace(tmp_path, path)
+    return os.path.getsize(path)
+
+
+def read_header(mapped):
+    if mapped[:len(MAGIC)] != MAGIC:
+        return None, 0
+    (length,) = HEADER_LENGTH.unpack_from(mapped, len(MAGIC))
+    start = len(MAGIC) + HEADER_LENGTH.size
+    return json.loads(bytes(mapped[start:start + length])), start + length
+
+
+# Sections of the artifact at `path` if it was compiled from the source with
+# `source_sha256` by a compatible build, every checksum matches and it loads; else None
+def read_artifact(path, source_sha256):
+    try:
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    with mapped:
+        header, data_offset = read_header(mapped)
+        if (header is None or header["format"] != FORMAT_VERSION
+                or header["python"] != list(sys.version_info[:2])
+                or header.get("code_sha256") != CODE_SHA256
+                or header["source_sha256"] != source_sha256):
+            return None
+        view = memoryview(mapped)
+        payloads = {}
+        try:
+            for name in SECTIONS:
+                entry = header["sections"][name]
+                start = data_offset + entry["offset"]
+                payloads[name] = view[start:start + entry["length"]]
+                if sha256_of(payloads[name]) != entry["sha256"]:
+                    return None
+            catalog = pickle.loads(payloads["catalog"])
+            sections = {"catalog": catalog}
+            for name in SECTIONS[1:]:
+                sections[name] = _SectionUnpickler(io.BytesIO(payloads[name]), catalog).load()
+            return sections
+        finally:
+            # The mapping can only be closed once no view of it is left
+            for payload in payloads.values():
+                payload.release()
+            view.release()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate the catalog and compile it into an artifact.")
+    parser.add_argument("--source", default=CATALOG_PATH)
+    parser.add_argument("--out", default=ARTIFACT_PATH)
+    parser.add_argument("--strict", action="store_true", help="treat EN/AR parity differences as errors")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    with open(args.source, "rb") as f:
+        source = f.read()
+    data = json.loads(source)
+    try:
+        validate_catalog(data)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        sys.exit(1)
+    warnings = parity_warnings(data)
+    for warning in warnings:
+        print(f"warning: {warning}", file=sys.stderr)
+    if warnings and args.strict:
+        sys.exit(1)
+
+    sections = build_sections(Catalog(data))
+    size = write_artifact(sections, sha256_of(source), args.out)
+    print(f"Compiled catalog version {data['version']} into {args.out} ({size} bytes, "
+          f"{len(warnings)} warnings) in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
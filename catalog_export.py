@@ -0,0 +1,185 @@
+# Static JSON API of the catalog for partner apps and browser extensions.
+#
+#   python catalog_export.py [--source data/catalog.json] [--out public]
+#
+# writes, under <out>/api/v1/:
+#   catalog.json          the current catalog (records in the source schema, by section)
+#   catalog-v<N>.json     the same, frozen per version (immutable, cached for a year)
+#   delta/<N>.json        the records added, changed or removed since version N
+#   index.json            current version, ETags and sizes of every file above
+# plus <out>/_headers (Netlify / Cloudflare Pages format) with a strong ETag and
+# Cache-Control for every file, so a CDN can serve and revalidate them.
+#
+# Deltas are computed against the catalog-v<N>.json files of earlier exports, so keep
+# the output directory between runs; only the last DELTA_HISTORY versions get a delta,
+# older clients download catalog.json again. A client holding version N fetches
+# index.json, then delta/<N>.json, and applies the upserts and deletions by ID.
+#
+# catalog-v<N>.json is cached as immutable, so a version is never exported twice with
+# different content: the export refuses until `version` is bumped.
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+
+from catalog import CATALOG_PATH, validate_catalog
+
+API_PATH = "api/v1"
+DELTA_HISTORY = 20
+
+# Record sections of the API and where they are in the source catalog
+SECTIONS = {
+    "boycott_categories": ("boycott", "categories"),
+    "companies": ("boycott", "companies"),
+    "brands": ("brands",),
+    "brand_lists": ("brand_lists",),
+    "education_categories": ("education", "categories"),
+    "resources": ("education", "resources"),
+}
+
+MUTABLE_CACHE = "public, max-age=300, must-revalidate"
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+
+
+def encode(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+def etag(data):
+    return '"' + hashlib.sha256(data).hexdigest()[:32] + '"'
+
+
+def api_catalog(data):
+    sections = {}
+    for name, path in SECTIONS.items():
+        value = data
+        for key in path:
+            value = value.get(key, {} if key != path[-1] else [])
+        sections[name] = value
+    return {"version": data["version"], "languages": data["languages"], "sections": sections}
+
+
+# Records of `new` that are not identical in `old`, and IDs that are gone, by section
+def delta(old, new):
+    changes = {"from": old["version"], "to": new["version"], "upserts": {}, "deletes": {}}
+    for name in SECTIONS:
+        old_records = {record["id"]: encode(record) for record in old["sections"].get(name, [])}
+        new_records = new["sections"][name]
+        upserts = [record for record in new_records if old_records.get(record["id"]) != encode(record)]
+        deletes = sorted(set(old_records) - {record["id"] for record in new_records})
+        if upserts:
+            changes["upserts"][name] = upserts
+        if deletes:
+            changes["deletes"][name] = deletes
+    return changes
+
+
+def write_file(root, relative, data, files):
+    path = os.path.join(root, relative)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    files[relative] = {"etag": etag(data), "size": len(data)}
+
+
+# Write the rules of one exporter to <root>/_headers, keeping the rules of the others
+# (the JSON API and the static site, export_site.py, can share an output directory).
+# `rules` maps URL paths to their header lines; existing rules for which `owned(url)`
+# is true are this exporter's own and are dropped.
+def write_headers(root, rules, owned):
+    path = os.path.join(root, "_headers")
+    blocks = {}
+    if os.path.exists(path):
+        url = None
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                if not line[0].isspace():
+                    url = line.strip()
+                    blocks[url] = ""
+                elif url is not None:
+                    blocks[url] += line
+    blocks = {url: headers for url, headers in blocks.items() if not owned(url)}
+    blocks.update(rules)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(f"{url}\n{headers}" for url, headers in sorted(blocks.items())))
+
+
+def export(data, root):
+    current = api_catalog(data)
+    version = current["version"]
+    api_root = os.path.join(root, API_PATH)
+    files = {}
+
+    # Earlier exported versions, newest first
+    previous = {}
+    for path in glob.glob(os.path.join(api_root, "catalog-v*.json")):
+        match = re.fullmatch(r"catalog-v(\d+)\.json", os.path.basename(path))
+        if match and int(match.group(1)) != version:
+            previous[int(match.group(1))] = path
+    kept = sorted(previous, reverse=True)[:DELTA_HISTORY]
+
+    catalog_bytes = encode(current)
+    frozen_path = os.path.join(api_root, f"catalog-v{version}.json")
+    if os.path.exists(frozen_path):
+        with open(frozen_path, "rb") as f:
+            if f.read() != catalog_bytes:
+                raise ValueError(f"catalog version {version} was already exported with different content; "
+                                 "bump the catalog version")
+    write_file(root, f"{API_PATH}/catalog.json", catalog_bytes, files)
+    write_file(root, f"{API_PATH}/catalog-v{version}.json", catalog_bytes, files)
+    write_file(root, f"{API_PATH}/delta/{version}.json", encode(delta(current, current)), files)
+    for old_version in kept:
+        with open(previous[old_version], "rb") as f:
+            old_bytes = f.read()
+        write_file(root, f"{API_PATH}/delta/{old_version}.json", encode(delta(json.loads(old_bytes), current)), files)
+        files[f"{API_PATH}/catalog-v{old_version}.json"] = {"etag": etag(old_bytes), "size": len(old_bytes)}
+    # Deltas from versions that fell out of the history would be stale
+    for path in glob.glob(os.path.join(api_root, "delta", "*.json")):
+        name = os.path.basename(path)[:-len(".json")]
+        if name.isdigit() and int(name) != version and int(name) not in kept:
+            os.remove(path)
+
+    index = {"version": version, "delta_from": sorted([version, *kept]), "files": files}
+    write_file(root, f"{API_PATH}/index.json", encode(index), files)
+
+    rules = {}
+    for relative, info in files.items():
+        immutable = re.search(r"/catalog-v\d+\.json$", relative)
+        rules[f"/{relative}"] = (f"  ETag: {info['etag']}\n"
+                                 f"  Cache-Control: {IMMUTABLE_CACHE if immutable else MUTABLE_CACHE}\n"
+                                 f"  Access-Control-Allow-Origin: *\n")
+    write_headers(root, rules, lambda url: url.startswith(f"/{API_PATH}/"))
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the catalog as a static JSON API.")
+    parser.add_argument("--source", default=CATALOG_PATH)
+    parser.add_argument("--out", default="public")
+    args = parser.parse_args()
+
+    with open(args.source, encoding="utf-8") as f:
+        data = json.load(f)
+    try:
+        validate_catalog(data)
+        files = export(data, args.out)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        sys.exit(1)
+    full = files[f"{API_PATH}/catalog.json"]["size"]
+    deltas = {name: info["size"] for name, info in files.items() if "/delta/" in name}
+    print(f"Exported catalog version {data['version']} to {os.path.join(args.out, API_PATH)} "
+          f"({full} bytes, {len(deltas)} deltas)")
+    for name, size in sorted(deltas.items()):
+        print(f"  {name}: {size} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+import re
+import unicodedata
+
+# Fuzzy name search over the boycott catalog: company and brand names in every language,
+# their aliases and the companies of the brand lists. The index is built once per catalog
+# version and shared by every session; a lookup is a dict probe for exact names and a
+# trigram probe ranked by edit distance for everything else.
+
+# Smallest similarity (1 - edit distance / length) of a fuzzy match
+MIN_SIMILARITY = 0.6
+# Trigram candidates checked with the edit distance, best overlap first
+MAX_CANDIDATES = 20
+# Share of the query's trigrams a candidate must contain
+MIN_OVERLAP = 0.3
+# Words that make an ambiguous name (Company.ambiguous_names) in free text mean the
+# catalog record: the text is about shopping or the boycott
+MENTION_CONTEXT = (
+    "boycott", "boycotting", "boycotted", "buy", "buying", "bought", "purchase", "product", "products",
+    "brand", "brands", "company", "companies", "shop", "shopping", "store", "sell", "sells", "selling",
+    "مقاطعه", "المقاطعه", "قاطع", "اقاطع", "نقاطع", "شراء", "اشتري", "منتج", "منتجات", "ماركه", "علامه",
+    "شركه", "الشركه", "شركات",
+)
+
+_ARABIC_MARKS = re.compile(r"[\u0610-\u061A\u064B-\u065F\u0670\u0640]")
+_ARABIC_LETTERS = str.maketrans({"أ": "ا", "إ": "ا", "آ": "ا", "ٱ": "ا", "ى": "ي", "ة": "ه", "ؤ": "و", "ئ": "ي"})
+
+
+# "L'Oréal" -> "loreal", "H&M" -> "hm", "Coca-Cola" -> "coca cola", "ستاربكس" stays Arabic
+def normalize_name(name):
+    text = unicodedata.normalize("NFKD", name.casefold())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    text = _ARABIC_MARKS.sub("", unicodedata.normalize("NFKC", text)).translate(_ARABIC_LETTERS)
+    text = re.sub(r"['’`&]", "", text)
+    text = re.sub(r"[^\w\s]|_", " ", text)
+    return " ".join(text.split())
+
+
+# Spaces and hyphens are spelled inconsistently ("coca cola", "cocacola"), so names are
+# compared without them
+def _squash(normalized):
+    return normalized.replace(" ", "")
+
+
+# One regex matching any of `names` (normalized, spaces optional) as whole words, built
+# as a trie so the regex engine follows shared prefixes once instead of trying every name
+def names_pattern(names):
+    trie = {}
+    for name in names:
+        node = trie
+        for char in name:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def branch(node):
+        end = "" in node
+        parts = [(" ?" if char == " " else re.escape(char)) + branch(child)
+                 for char, child in sorted(node.items()) if char]
+        if not parts:
+            return ""
+        body = parts[0] if len(parts) == 1 else "(?:" + "|".join(parts) + ")"
+        if end:
+            return f"(?:{body})?" if len(parts) > 1 or len(parts[0]) > 1 else body + "?"
+        return body
+
+    return re.compile(r"(?<!\w)" + branch(trie) + r"(?!\w)") if trie else None
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+# Levenshtein distance, giving up once it is larger than `limit`
+def edit_distance(a, b, limit):
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+# One search result: the matched catalog record (a Company, a Brand, or the BrandList
+# that lists the name), the name or alias that matched, and how close it was (1.0 = exact)
+class Match:
+    __slots__ = ("record", "name", "score")
+
+    def __init__(self, record, name, score):
+        self.record = record
+        self.name = name
+        self.score = score
+
+    def __repr__(self):
+        return f"Match({self.record.id!r}, {self.name!r}, {self.score:.2f})"
+
+
+class SearchIndex:
+    def __init__(self, catalog):
+        self.version = catalog.version
+        # (squashed name, display name, record), one per distinct name of a record
+        self.entries = []
+        self.exact = {}
+        self.by_trigram = {}
+        # entry index -> the record's own context words, for the entries of ambiguous
+        # names (see scan)
+        self.mention_context = {}
+        self.general_context = frozenset(normalize_name(word) for word in MENTION_CONTEXT)
+
+        seen = set()
+        names = set()
+
+        def add(name, record):
+            normalized = normalize_name(name)
+            key = _squash(normalized)
+            if not key or (key, record) in seen:
+                # Still scan for this spelling ("kit kat" next to "kitkat")
+                if key:
+                    names.add(normalized)
+                return
+            seen.add((key, record))
+            index = len(self.entries)
+            self.entries.append((key, name, record))
+            if name in (getattr(record, "ambiguous_names", None) or ()):
+                self.mention_context[index] = frozenset(normalize_name(word) for word in record.context or ())
+            self.exact.setdefault(key, []).append(index)
+            for gram in trigrams(key):
+                self.by_trigram.setdefault(gram, []).append(index)
+            names.add(normalized)
+
+        for company in catalog.companies:
+            for name in company.name:
+                if name:
+                    add(name, company)
+            for alias in company.aliases or ():
+                add(alias, company)
+        for brand in catalog.brands:
+            for name in (*brand.name, *(brand.aliases or ())):
+                if name:
+                    add(name, brand)
+        # Brand-list names that are also catalog companies or brands resolve to them
+        for brand_list in catalog.brand_lists:
+            for name in brand_list.companies:
+                if _squash(normalize_name(name)) not in self.exact:
+                    add(name, brand_list)
+
+        # Every known name at once, for scanning whole texts (see shopping_list.py)
+        self.pattern = names_pattern(names)
+
+    def search(self, query, limit=5):
+        key = _squash(normalize_name(query))
+        if not key:
+            return []
+        scores = {}
+
+        def consider(index, score):
+            record = self.entries[index][2]
+            best = scores.get(record)
+            if best is None or score > best[1]:
+                scores[record] = (index, score)
+
+        for index in self.exact.get(key, ()):
+            consider(index, 1.0)
+
+        # Candidates sharing the most trigrams with the query
+        overlap = {}
+        grams = trigrams(key)
+        for gram in grams:
+            for index in self.by_trigram.get(gram, ()):
+                overlap[index] = overlap.get(index, 0) + 1
+        threshold = max(1, int(len(grams) * MIN_OVERLAP))
+        candidates = sorted((index for index, count in overlap.items() if count >= threshold),
+                            key=overlap.get, reverse=True)[:MAX_CANDIDATES]
+
+        for index in candidates:
+            name = self.entries[index][0]
+            if name == key:
+                continue
+            if name.startswith(key) and len(key) >= 3:
+                # Typing the start of a name ("starb") ranks by how much of it is typed
+                consider(index, 0.8 + 0.15 * len(key) / len(name))
+                continue
+            limit_distance = int(max(len(key), len(name)) * (1 - MIN_SIMILARITY))
+            distance = edit_distance(key, name, limit_distance)
+            if distance <= limit_distance:
+                consider(index, 0.9 * (1 - distance / max(len(key), len(name))))
+
+        ranked = sorted(scores.values(), key=lambda item: -item[1])
+        return [Match(self.entries[index][2], self.entries[index][1], score) for index, score in ranked[:limit]]
+
+    # Whether a match is on an ambiguous name, e.g. a fuzzy match of "apples" on "Apple"
+    def is_ambiguous(self, match):
+        return match.name in (getattr(match.record, "ambiguous_names", None) or ())
+
+    # Entry indexes of the exact names and aliases in a normalized text, in order, with one
+    # regex pass. An ambiguous name ("Sabra and Shatila", "apple juice", "cat food") only
+    # counts with one of its record's context words ("hummus") in the text, or one of
+    # `context`: find_mentions adds the shopping and boycott words of MENTION_CONTEXT.
+    def scan(self, normalized, context=frozenset()):
+        if self.pattern is None:
+            return []
+        words = set(normalized.split())
+        found = []
+        for hit in self.pattern.finditer(normalized):
+            for index in self.exact.get(hit.group().replace(" ", ""), ()):
+                own = self.mention_context.get(index)
+                if own is None or own & words or context & words:
+                    found.append(index)
+        return found
+
+    # Catalog companies and brands named in free text (exact names and aliases only), in
+    # order of first mention
+    def find_mentions(self, text):
+        found = {}
+        for index in self.scan(normalize_name(text), self.general_context):
+            _, name, record = self.entries[index]
+            if record not in found:
+                found[record] = Match(record, name, 1.0)
+        return list(found.values())
+
@@ -0,0 +1,116 @@
+import hashlib
+import os
+import sys
+import threading
+import time
+import traceback
+
+from catalog import CATALOG_PATH, read_catalog
+from catalog_compiler import ARTIFACT_PATH, build_sections, read_artifact
+
+# Hot reload of the content catalog. Sessions read one immutable Snapshot: the catalog
+# and everything derived from it (search index, ownership closure, rendered HTML).
+# A watcher thread polls the data file; when it changes, the new file is validated and
+# the whole snapshot is rebuilt in the background, then published with a single
+# reference assignment. Readers keep the snapshot they started with, so they never see
+# a mix of versions, and nothing restarts. An invalid file is reported and ignored.
+# When catalog_compiler.py has compiled the current file, the snapshot is loaded from
+# its artifact instead of being rebuilt.
+
+# How often the watcher looks at the data file, in seconds
+CATALOG_CHECK_INTERVAL = float(os.getenv("CATALOG_CHECK_INTERVAL", "2"))
+
+
+class Snapshot:
+    def __init__(self, sections):
+        self.catalog = sections["catalog"]
+        self.version = self.catalog.version
+        self.search = sections["search"]
+        self.ownership = sections["ownership"]
+        # {language: {(kind, id): html}}, see render.render_catalog
+        self.html = sections["html"]
+
+    def search_companies(self, query, limit=5):
+        return self.search.search(query, limit)
+
+    def find_mentions(self, text):
+        return self.search.find_mentions(text)
+
+    def boycotted_owners(self, record_id):
+        return self.ownership.boycotted_owners(record_id)
+
+
+_snapshot = None
+_snapshot_stat = None
+# sha256 of the file last read (an ignored edit is reported once)
+_snapshot_sha256 = None
+_watcher = None
+_lock = threading.Lock()
+
+
+def _file_identity(path):
+    stat = os.stat(path)
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+# Build and publish a snapshot of the file if it changed. Returns True when a new
+# version was published.
+def reload(path=CATALOG_PATH):
+    global _snapshot, _snapshot_stat, _snapshot_sha256
+    identity = _file_identity(path)
+    if identity == _snapshot_stat:
+        return False
+    previous = _snapshot
+    with open(path, "rb") as f:
+        source_sha256 = hashlib.file_digest(f, "sha256").hexdigest()
+    sections = read_artifact(ARTIFACT_PATH, source_sha256)
+    if sections is None:
+        try:
+            catalog = read_catalog(path)
+        except Exception:
+            # Report a broken file once, not on every check
+            if previous is not None:
+                _snapshot_stat = identity
+            raise
+    else:
+        catalog = sections["catalog"]
+    # The file changed but the version did not: nothing to rebuild. Versions are what
+    # caches and exports are keyed by, so an edit without a version bump is ignored, and
+    # said so.
+    if previous is not None and catalog.version == previous.version:
+        if source_sha256 != _snapshot_sha256:
+            print(f"Catalog file changed but its version is still {catalog.version}: edit ignored, "
+                  "bump `version` to publish it", file=sys.stderr)
+        _snapshot_stat, _snapshot_sha256 = identity, source_sha256
+        return False
+    if sections is None:
+        sections = build_sections(catalog, previous.ownership if previous else None)
+    _snapshot, _snapshot_stat, _snapshot_sha256 = Snapshot(sections), identity, source_sha256
+    return True
+
+
+def _watch(path):
+    while True:
+        time.sleep(CATALOG_CHECK_INTERVAL)
+        try:
+            if reload(path):
+                print(f"Catalog reloaded: version {_snapshot.version}", file=sys.stderr)
+        except Exception:
+            # Keep serving the last good version until the file is fixed
+            print("Catalog reload failed, keeping version "
+                  f"{_snapshot.version}:\n{traceback.format_exc()}", file=sys.stderr)
+
+
+# The current snapshot. The first call loads the catalog and starts the watcher.
+def current():
+    global _watcher
+    snapshot = _snapshot
+    if snapshot is not None:
+        return snapshot
+    with _lock:
+        if _snapshot is None:
+            reload()
+        if _watcher is None and CATALOG_CHECK_INTERVAL > 0:
+            _watcher = threading.Thread(target=_watch, args=(CATALOG_PATH,), name="catalog-watcher", daemon=True)
+            _watcher.start()
+    return _snapshot
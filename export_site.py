@@ -0,0 +1,178 @@
+# Static site of the boycott and education pages, in every language of the catalog, for
+# any static host or CDN: the read-only part of the app, served without a Python process.
+#
+#   python export_site.py [--source data/catalog.json] [--out public] [--chat-url URL]
+#
+# writes, under <out>:
+#   <language>/boycott/index.html     companies by category, how to support Gaza, BDS
+#   <language>/education/index.html   educational resources by category, further reading
+#   index.html                        redirect to the English boycott page
+#   assets/site.<hash>.css            the app theme (render.THEME_CSS) and the page layout
+#   assets/flag.<hash>.svg
+# plus the site's rules in <out>/_headers (Netlify / Cloudflare Pages format): pages get
+# an ETag and are revalidated after a few minutes, assets have content-hashed names and
+# are cached for a year. Assets of earlier exports are kept, so pages still cached with
+# the old URLs keep working.
+#
+# Pages are built from the same HTML fragments as the app (render.render_catalog), so
+# both show the same content; the interactive parts (search, shopping-list checker, the
+# chat) need the app, which --chat-url links to. With STATIC_SITE_URL set, the app links
+# to this site instead of serving the boycott and education pages itself.
+import argparse
+import hashlib
+import html
+import os
+
+from assets import STATIC_DIR
+from catalog import CATALOG_PATH, read_catalog
+from catalog_export import IMMUTABLE_CACHE, MUTABLE_CACHE, write_file, write_headers
+from render import CONTENT_LABELS, THEME_CSS, block, render_catalog
+
+PAGES = ("boycott", "education")
+
+# Labels of the site around the catalog content, per language
+SITE_LABELS = {
+    "en": {
+        "name": "English",
+        "boycott": "Boycott Information",
+        "education": "Educational Resources",
+        "chat": "Chat with Palestina AI",
+    },
+    "ar": {
+        "name": "العربية",
+        "boycott": "معلومات المقاطعة",
+        "education": "الموارد التعليمية",
+        "chat": "تحدث مع فلسطينا AI",
+    },
+}
+
+FOOTER = "Palestine AI - Developed by Elkalem-Imrou Height School in collaboration with Erinov Company"
+
+# Layout of the site pages; the content blocks are styled by THEME_CSS
+SITE_CSS = (
+    "body{margin:0 auto;max-width:60rem;padding:0 1rem 2rem;font-family:Arial,Helvetica,sans-serif;color:#262730}"
+    "header{display:flex;flex-wrap:wrap;align-items:center;gap:.5rem 1.5rem;padding:1rem 0;"
+    "border-bottom:1px solid #ddd;margin-bottom:1rem}"
+    "header nav{display:flex;flex-wrap:wrap;gap:.5rem 1rem}"
+    "header a{color:#1f77b4}header a[aria-current]{font-weight:700;text-decoration:none}"
+    "details{border:1px solid #ddd;border-radius:.5rem;padding:.5rem 1rem;margin:.5rem 0}"
+    "summary{cursor:pointer;font-weight:600}"
+    "footer{margin-top:2rem;border-top:1px solid #ddd;padding-top:1rem;text-align:center}"
+)
+
+
+# Write `data` under a name carrying a hash of its content; returns the relative path
+def write_asset(root, name, data, files):
+    stem, extension = os.path.splitext(name)
+    relative = f"assets/{stem}.{hashlib.sha256(data).hexdigest()[:12]}{extension}"
+    write_file(root, relative, data, files)
+    return relative
+
+
+def category_nav(categories, language):
+    links = " · ".join(f'<a href="#{category.id}">{category.text("name", language)}</a>' for category in categories)
+    return block(f"<p>{links}</p>", language)
+
+
+# Companies of every category, each in a collapsed <details> like the app's expanders
+def boycott_body(catalog, fragments, language):
+    parts = [fragments[("page", "boycott_intro")], category_nav(catalog.boycott_categories, language)]
+    for category in catalog.boycott_categories:
+        parts.append(f'<section id="{category.id}">{fragments[("boycott_category", category.id)]}')
+        for company in catalog.companies_by_category[category.id]:
+            parts.append(f"<details><summary>{html.escape(company.text('name', language))}</summary>"
+                         f"{fragments[('company', company.id)]}</details>")
+        parts.append("</section>")
+    parts += [fragments[("page", "support_gaza")], fragments[("page", "bds")]]
+    return "".join(parts)
+
+
+# Educational resources of every category that has some in `language`
+def education_body(catalog, fragments, language):
+    categories = [category for category in catalog.education_categories
+                  if catalog.resources_in(category.id, language)]
+    parts = [fragments[("page", "education_intro")], category_nav(categories, language)]
+    for category in categories:
+        parts.append(f'<section id="{category.id}">{fragments[("education_category", category.id)]}')
+        for resource in catalog.resources_in(category.id, language):
+            parts.append(f"<details><summary>{html.escape(resource.text('title', language))}</summary>"
+                         f"{fragments[('resource', resource.id)]}</details>")
+        parts.append("</section>")
+    parts.append(fragments[("page", "reading")])
+    return "".join(parts)
+
+
+PAGE_BODIES = {"boycott": boycott_body, "education": education_body}
+
+
+# One page of the site; pages live at <language>/<page>/, two levels below the root
+def page_html(catalog, fragments, page, language, assets, chat_url):
+    labels = SITE_LABELS[language]
+    direction = CONTENT_LABELS[language]["dir"]
+    links = [f'<a href="../{name}/"{" aria-current=page" if name == page else ""}>{labels[name]}</a>'
+             for name in PAGES]
+    if chat_url:
+        links.append(f'<a href="{html.escape(chat_url)}">{labels["chat"]}</a>')
+    links += [f'<a href="../../{other}/{page}/" lang="{other}" hreflang="{other}">{SITE_LABELS[other]["name"]}</a>'
+              for other in catalog.languages if other != language]
+    return (
+        f'<!DOCTYPE html><html lang="{language}" dir="{direction}"><head>'
+        '<meta charset="utf-8"><meta name="viewport" content="width=device-width,initial-scale=1">'
+        f"<title>{labels[page]} - Palestina AI</title>"
+        f'<link rel="stylesheet" href="../../{assets["css"]}"><link rel="icon" href="../../{assets["flag"]}">'
+        f'</head><body><header><img src="../../{assets["flag"]}" width="60" height="30" alt="">'
+        f'<strong>Palestina AI</strong><nav>{"".join(links)}</nav></header>'
+        f"<main>{PAGE_BODIES[page](catalog, fragments, language)}</main>"
+        f"<footer>{FOOTER}</footer></body></html>"
+    )
+
+
+def export(catalog, root, chat_url=None):
+    files = {}
+    html_by_language = render_catalog(catalog)
+    with open(os.path.join(STATIC_DIR, "flag.svg"), "rb") as f:
+        assets = {
+            "css": write_asset(root, "site.css", (THEME_CSS + SITE_CSS).encode("utf-8"), files),
+            "flag": write_asset(root, "flag.svg", f.read(), files),
+        }
+    pages = {}
+    for language in catalog.languages:
+        for page in PAGES:
+            relative = f"{language}/{page}/index.html"
+            data = page_html(catalog, html_by_language[language], page, language, assets, chat_url).encode("utf-8")
+            write_file(root, relative, data, files)
+            pages[f"/{language}/{page}/"] = relative
+    write_file(root, "index.html", b'<!DOCTYPE html><meta charset="utf-8"><title>Palestina AI</title>'
+               b'<meta http-equiv="refresh" content="0; url=en/boycott/"><a href="en/boycott/">Palestina AI</a>', files)
+    pages["/"] = "index.html"
+
+    # Rules by URL path: hosts serve <path>/index.html at <path>/
+    rules = {url: f"  ETag: {files[relative]['etag']}\n  Cache-Control: {MUTABLE_CACHE}\n"
+             for url, relative in pages.items()}
+    # Every asset on disk, those of earlier exports included (but no leftover temporary
+    # file of an interrupted write)
+    for name in sorted(os.listdir(os.path.join(root, "assets"))):
+        if name.endswith(".tmp"):
+            continue
+        rules[f"/assets/{name}"] = f"  Cache-Control: {IMMUTABLE_CACHE}\n"
+    site_prefixes = tuple(f"/{language}/" for language in catalog.languages) + ("/assets/",)
+    write_headers(root, rules, lambda url: url == "/" or url.startswith(site_prefixes))
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the boycott and education pages as a static site.")
+    parser.add_argument("--source", default=CATALOG_PATH)
+    parser.add_argument("--out", default="public")
+    parser.add_argument("--chat-url", default=None, help="URL of the app, linked from every page")
+    args = parser.parse_args()
+
+    catalog = read_catalog(args.source)
+    files = export(catalog, args.out, args.chat_url)
+    print(f"Exported catalog version {catalog.version} as a static site to {args.out}")
+    for name, info in sorted(files.items()):
+        print(f"  {name}: {info['size']} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# Offline pre-generation of FAQ answers in English and Arabic.
+#
+#   python faq_batch.py questions.txt [--languages en ar] [--workers 4] [--rpm 30]
+#
+# The question list is a text file (one question per line) or a CSV file (question in
+# the first column). Questions are canonicalized and deduplicated, then answered through a
+# concurrency-limited, rate-limited worker pool and written to the answer store with their
+# model and prompt version. Answers already in the store are skipped, so an interrupted
+# run resumes where it stopped. The chat reads the store before calling the model.
+# Each question is answered in its own language, which is the language the chat answers
+# it in; list a question in both languages to have both answers. --languages only keeps
+# the questions in those languages. Answers are stored as kind "faq", which the chat
+# serves in every mode, deep mode included.
+import argparse
+import csv
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import answer_store
+from ai_service import (
+    MODEL_NAME,
+    PROMPT_VERSION,
+    build_palestine_prompt,
+    cache_key,
+    canonical_question,
+    detect_language,
+    generate_text,
+)
+
+# Errors worth retrying after a pause; anything else is reported as a failure right away
+RETRYABLE_ERRORS = ("quota", "timed out", "timeout", "unavailable", "429", "503")
+
+
+# Spaces calls evenly so the whole pool stays under `rpm` requests per minute
+class RateLimiter:
+    def __init__(self, rpm):
+        self.interval = 60.0 / rpm if rpm > 0 else 0.0
+        self.next_slot = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            wait = self.next_slot - now
+            self.next_slot = max(now, self.next_slot) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+def load_questions(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.lower().endswith(".csv"):
+            rows = [row[0] for row in csv.reader(f) if row]
+        else:
+            rows = list(f)
+    # Keep the first spelling of every canonical question
+    questions = {}
+    for row in rows:
+        question = row.strip()
+        canonical = canonical_question(question)
+        if canonical and canonical not in questions:
+            questions[canonical] = question
+    return questions
+
+
+def answer_one(question, canonical, language, limiter, retries, store_path):
+    key = cache_key("faq", question, language=language)
+    for attempt in range(retries + 1):
+        limiter.acquire()
+        text = generate_text(build_palestine_prompt(question, language=language))
+        if not text.startswith("❌"):
+            answer_store.put_answer(key.id, question, canonical, language, "faq", MODEL_NAME,
+                                    PROMPT_VERSION, text, path=store_path)
+            return None
+        if attempt < retries and any(word in text.lower() for word in RETRYABLE_ERRORS):
+            time.sleep(2 ** attempt * 5)
+            continue
+        return text
+    return text
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-generate FAQ answers into the answer store.")
+    parser.add_argument("questions", help="text file (one question per line) or CSV file")
+    parser.add_argument("--languages", nargs="+", default=["en", "ar"], choices=["en", "ar"],
+                        help="only answer the questions in these languages")
+    parser.add_argument("--workers", type=int, default=4, help="concurrent model calls")
+    parser.add_argument("--rpm", type=float, default=30, help="maximum requests per minute (0 = unlimited)")
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--store", default=answer_store.STORE_PATH)
+    args = parser.parse_args()
+
+    questions = load_questions(args.questions)
+    tasks = []
+    skipped = 0
+    for canonical, question in questions.items():
+        language = detect_language(question)
+        if language not in args.languages:
+            continue
+        if answer_store.has_answer(cache_key("faq", question, language=language).id, path=args.store):
+            skipped += 1
+        else:
+            tasks.append((question, canonical, language))
+
+    print(f"{len(questions)} unique questions, {len(tasks)} answers to generate, "
+          f"{skipped} already in the store ({MODEL_NAME}, prompt v{PROMPT_VERSION})")
+
+    limiter = RateLimiter(args.rpm)
+    failures = []
+    done = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = {
+            pool.submit(answer_one, question, canonical, language, limiter, args.retries, args.store):
+                (question, language)
+            for question, canonical, language in tasks
+        }
+        try:
+            for future in as_completed(futures):
+                error = future.result()
+                if error:
+                    failures.append((*futures[future], error))
+                else:
+                    done += 1
+                finished = done + len(failures)
+                if finished % 10 == 0 or finished == len(tasks):
+                    elapsed = time.perf_counter() - start
+                    print(f"  {finished}/{len(tasks)}  {done / elapsed * 60:.1f} answers/min  {len(failures)} failed")
+        except KeyboardInterrupt:
+            print("Interrupted; finished answers are stored, run again to resume.")
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    elapsed = time.perf_counter() - start
+    print(f"Generated {done} answers in {elapsed:.1f}s "
+          f"({done / elapsed * 60 if elapsed else 0:.1f} answers/min), {len(failures)} failed, {skipped} skipped")
+    for question, language, error in failures:
+        print(f"  FAILED [{language}] {question}: {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# Brand -> owner graph of the boycott catalog ("owners" of companies and brands) with its
+# transitive closure kept up to date, so "is Garnier boycotted?" is one dict lookup that
+# returns Garnier and L'Oréal. The graph of a new catalog version is derived from the
+# previous one by applying only the edges that changed.
+
+
+class OwnershipGraph:
+    def __init__(self, edges=()):
+        # Direct edges both ways
+        self.parents = {}
+        self.children = {}
+        # Closure: node -> {ancestor: distance} and node -> {descendant: distance}
+        self.ancestors = {}
+        self.descendants = {}
+        for child, parent in edges:
+            self.add_edge(child, parent)
+
+    def copy(self):
+        graph = OwnershipGraph()
+        for name in ("parents", "children", "ancestors", "descendants"):
+            setattr(graph, name, {node: set(values) if isinstance(values, set) else dict(values)
+                                  for node, values in getattr(self, name).items()})
+        return graph
+
+    def edges(self):
+        return {(child, parent) for child, parents in self.parents.items() for parent in parents}
+
+    # Every owner of `node`, direct or not, nearest first
+    def owners(self, node):
+        ancestors = self.ancestors.get(node, {})
+        return sorted(ancestors, key=lambda owner: (ancestors[owner], owner))
+
+    def add_edge(self, child, parent):
+        if child == parent or child in self.ancestors.get(parent, {}):
+            raise ValueError(f"ownership cycle: {child} -> {parent}")
+        if parent in self.parents.get(child, ()):
+            return
+        self.parents.setdefault(child, set()).add(parent)
+        self.children.setdefault(parent, set()).add(child)
+
+        # Every descendant of `child` (and child itself) gains `parent` and its ancestors
+        upper = {parent: 0, **self.ancestors.get(parent, {})}
+        lower = {child: 0, **self.descendants.get(child, {})}
+        for low, low_distance in lower.items():
+            ancestors = self.ancestors.setdefault(low, {})
+            for high, high_distance in upper.items():
+                distance = low_distance + 1 + high_distance
+                if distance < ancestors.get(high, distance + 1):
+                    ancestors[high] = distance
+                    self.descendants.setdefault(high, {})[low] = distance
+
+    def remove_edge(self, child, parent):
+        if parent not in self.parents.get(child, ()):
+            return
+        self.parents[child].discard(parent)
+        self.children[parent].discard(child)
+
+        # Only `child` and its descendants can lose ancestors or get farther from them;
+        # recompute their closure from their direct parents, parents before children
+        affected = self._top_down({child, *self.descendants.get(child, {})})
+        for node in affected:
+            for ancestor in self.ancestors.pop(node, {}):
+                self.descendants[ancestor].pop(node, None)
+        for node in affected:
+            ancestors = {}
+            for direct in self.parents.get(node, ()):
+                for high, distance in {direct: 0, **self.ancestors.get(direct, {})}.items():
+                    if distance + 1 < ancestors.get(high, distance + 2):
+                        ancestors[high] = distance + 1
+            self.ancestors[node] = ancestors
+            for high, distance in ancestors.items():
+                self.descendants.setdefault(high, {})[node] = distance
+
+    # `nodes` ordered so every node comes after its parents within `nodes`
+    def _top_down(self, nodes):
+        waiting = {node: len(self.parents.get(node, set()) & nodes) for node in nodes}
+        ready = [node for node, count in waiting.items() if count == 0]
+        ordered = []
+        while ready:
+            node = ready.pop()
+            ordered.append(node)
+            for child in self.children.get(node, ()):
+                if child in waiting:
+                    waiting[child] -= 1
+                    if waiting[child] == 0:
+                        ready.append(child)
+        return ordered
+
+    # Bring the graph to `edges`, touching only the edges that differ
+    def update(self, edges):
+        edges = set(edges)
+        current = self.edges()
+        for child, parent in current - edges:
+            self.remove_edge(child, parent)
+        for child, parent in edges - current:
+            self.add_edge(child, parent)
+
+
+def catalog_edges(catalog):
+    return {(record.id, owner) for record in (*catalog.companies, *catalog.brands)
+            for owner in record.owners or ()}
+
+
+# Ownership answers for one catalog version: the graph, and for every company and brand
+# the boycotted companies it belongs to (itself first), precomputed
+class Ownership:
+    def __init__(self, catalog, graph):
+        self.version = catalog.version
+        self.graph = graph
+        self.boycotted = {}
+        for record in (*catalog.companies, *catalog.brands):
+            chain = [record.id, *graph.owners(record.id)]
+            self.boycotted[record.id] = tuple(catalog.companies_by_id[node] for node in chain
+                                              if node in catalog.companies_by_id)
+
+    # Boycotted companies behind a company or brand ID, nearest first; empty if neither
+    # it nor any of its owners is on the list
+    def boycotted_owners(self, record_id):
+        return self.boycotted.get(record_id, ())
+
+
+
+# Ownership of `catalog`. With the Ownership of the previous catalog version, its graph
+# is copied and only the changed edges are applied.
+def build_ownership(catalog, previous=None):
+    if previous is None:
+        graph = OwnershipGraph(catalog_edges(catalog))
+    else:
+        graph = previous.graph.copy()
+        graph.update(catalog_edges(catalog))
+    return Ownership(catalog, graph)
@@ -0,0 +1,174 @@
+# Static sections of the app pages, per language, as markup for render.block(). They
+# are rendered with the catalog fragments (render.render_catalog), so every catalog
+# version carries them pre-rendered and the app emits each section with one call.
+
+PAGE_SECTIONS = {
+    "en": {
+        "hero": (
+            '<h1>Palestina AI - From the river to the sea</h1>'
+            '<blockquote><p>"The issue of Palestine is a trial that God has tested your conscience, resolve, wealth, and unity with."</p>'
+            '<footer>— Al-Bashir Al-Ibrahimi</footer></blockquote>'
+            '<div class="cols">'
+            '<div><h3>Historical Context</h3>'
+            '<p class="l">Palestine is a land with a deep-rooted history spanning thousands of years, and historical documents affirm that the Palestinian people are the rightful owners of this land. Palestine has been home to its indigenous population, who have preserved their presence and culture despite attempts at erasure and displacement throughout the ages.</p></div>'
+            '<div><h3>Current Situation</h3>'
+            '<p class="l">The Palestinian people continue to face severe humanitarian challenges due to ongoing occupation and blockade, particularly in the Gaza Strip, where residents are deprived of access to essential resources and services. These actions constitute clear violations of human rights and international law, which guarantee the right of peoples to live freely and with dignity in their homeland.</p></div>'
+            '</div>'
+        ),
+        "chat_intro": (
+            '<h2>Chat with AI about Palestine</h2>'
+            '<h3 class="sub">Ask Your Question</h3>'
+            "<p class=\"l\">Get accurate, detailed information about Palestine's history, current events, and humanitarian issues.</p>"
+        ),
+        "boycott_intro": (
+            '<h2>Boycott Information</h2>'
+            '<p class="l">The boycott movement aims to apply economic and political pressure on Israel to comply with international law and Palestinian rights. '
+            'This form of non-violent resistance is inspired by the South African anti-apartheid movement and has gained significant global support.</p>'
+            '<p class="l">Below is a detailed list of companies that support Israel, with explanations of their involvement and alternatives you can use instead.</p>'
+        ),
+        "support_gaza": (
+            '<h3>How to Support Gaza</h3>'
+            '<ol>'
+            '<li><strong>Boycott Products</strong>: Avoid purchasing products from companies supporting Israel</li>'
+            '<li><strong>Choose Alternatives</strong>: Use the suggested alternatives or find local options</li>'
+            '<li><strong>Raise Awareness</strong>: Share information about the situation in Gaza</li>'
+            '<li><strong>Donate</strong>: Support humanitarian organizations working in Gaza</li>'
+            '<li><strong>Advocate</strong>: Contact your representatives to demand action</li>'
+            '<li><strong>Join Protests</strong>: Participate in peaceful demonstrations</li>'
+            '</ol>'
+            '<p class="l n">Remember that economic pressure through boycotts has historically been an effective non-violent resistance strategy.</p>'
+        ),
+        "bds": (
+            '<h3>The BDS Movement (Boycott, Divestment, Sanctions)</h3>'
+            '<p class="l">The BDS movement was launched in 2005 by Palestinian civil society. It calls for three main actions:</p>'
+            '<ol>'
+            '<li><strong>Boycott</strong>: Refusing to purchase products and services from companies complicit in the occupation</li>'
+            '<li><strong>Divestment</strong>: Withdrawing investments from companies and institutions that profit from the occupation</li>'
+            '<li><strong>Sanctions</strong>: Pressuring for sanctions against Israel until it complies with international law</li>'
+            '</ol>'
+            '<p class="l">The BDS movement has three fundamental demands:</p>'
+            '<ol>'
+            '<li>End the occupation and colonization of all Arab lands</li>'
+            '<li>Recognize the fundamental rights of Arab-Palestinian citizens of Israel to full equality</li>'
+            '<li>Respect, protect, and promote the rights of Palestinian refugees to return to their homes and properties</li>'
+            '</ol>'
+            '<p class="l">For more information, visit <a href="https://bdsmovement.net/">the official BDS movement website</a>.</p>'
+        ),
+        "education_intro": (
+            '<h2>Educational Resources on Palestine</h2>'
+            '<p class="l">This section provides educational resources to help you learn more about Palestine, its history, culture, and current situation. '
+            'The information presented here is based on reliable sources, including reports from human rights organizations, United Nations documents, academic studies, and direct testimonies.</p>'
+        ),
+        "reading": (
+            '<h3>Recommended Reading and Viewing</h3>'
+            '<h4>Books</h4>'
+            '<ul>'
+            '<li><strong>"The Question of Palestine"</strong> by Edward Said</li>'
+            '<li><strong>"Palestine: A Modern History"</strong> by Ilan Pappé</li>'
+            '<li><strong>"The Ethnic Cleansing of Palestine"</strong> by Ilan Pappé</li>'
+            '<li><strong>"Gaza in Crisis"</strong> by Noam Chomsky and Ilan Pappé</li>'
+            '<li><strong>"The Hundred Years\' War on Palestine"</strong> by Rashid Khalidi</li>'
+            '</ul>'
+            '<h4>Documentaries</h4>'
+            '<ul>'
+            '<li><strong>"5 Broken Cameras"</strong> (2011) by Emad Burnat and Guy Davidi</li>'
+            '<li><strong>"The Salt of This Sea"</strong> (2008) by Annemarie Jacir</li>'
+            '<li><strong>"Gaza Fight for Freedom"</strong> (2019) by Abby Martin</li>'
+            '<li><strong>"Occupation 101"</strong> (2006) by Sufyan Omeish and Abdallah Omeish</li>'
+            '<li><strong>"The Wanted 18"</strong> (2014) by Amer Shomali and Paul Cowan</li>'
+            '</ul>'
+            '<h4>Reliable Websites</h4>'
+            '<ul>'
+            '<li><a href="https://www.aljazeera.com/palestine-israel-conflict/">Al Jazeera</a> - Comprehensive coverage of Middle East issues</li>'
+            '<li><a href="https://www.btselem.org/">B\'Tselem</a> - Israeli Information Center for Human Rights in the Occupied Territories</li>'
+            '<li><a href="https://www.palestine-studies.org/">Institute for Palestine Studies</a> - Academic research on Palestine</li>'
+            '<li><a href="https://www.unrwa.org/">UNRWA</a> - UN Relief and Works Agency for Palestine Refugees</li>'
+            '<li><a href="https://electronicintifada.net/">Electronic Intifada</a> - News, commentary, analysis, and reference materials about Palestine</li>'
+            '</ul>'
+        ),
+    },
+    "ar": {
+        "hero": (
+            '<h1 dir="ltr">Palestina AI From the river to the sea</h1>'
+            '<blockquote><p>"إن قضية فلسطين محنةٌ امتحن الله بها ضمائركم وهممكم وأموالكم ووحدتكم."</p>'
+            '<footer>— البشير الإبراهيمي</footer></blockquote>'
+            '<div class="cols">'
+            '<div><h3>السياق التاريخي</h3>'
+            '<p class="l">فلسطين أرض ذات تاريخ عريق يمتد لآلاف السنين، وتؤكد الوثائق التاريخية أن الشعب الفلسطيني هو المالك الشرعي لهذه الأرض. كانت فلسطين موطنًا لسكانها الأصليين، الذين حافظوا على وجودهم وثقافتهم رغم محاولات المحو والتهجير على مر العصور.</p></div>'
+            '<div><h3>الوضع الحالي</h3>'
+            '<p class="l">يستمر الشعب الفلسطيني في مواجهة تحديات إنسانية خطيرة بسبب الاحتلال المستمر والحصار، خاصة في قطاع غزة، حيث يُحرم السكان من الوصول إلى الموارد والخدمات الأساسية. تشكل هذه الإجراءات انتهاكات واضحة لحقوق الإنسان والقانون الدولي، الذي يضمن حق الشعوب في العيش بحرية وكرامة في وطنهم.</p></div>'
+            '</div>'
+        ),
+        "chat_intro": (
+            '<h2>Chat with AI about Palestine</h2>'
+            '<h3 class="sub">Ask Your Question</h3>'
+            '<p class="l"> احصل على معلومات دقيقة ومفصلة حول تاريخ فلسطين والأحداث الجارية باستعمال الذكاء الاصطناعي.</p>'
+        ),
+        "boycott_intro": (
+            '<h2>معلومات المقاطعة</h2>'
+            '<p class="l">تهدف حركة المقاطعة إلى ممارسة ضغط اقتصادي وسياسي على إسرائيل للامتثال للقانون الدولي وحقوق الفلسطينيين. '
+            'هذا الشكل من المقاومة اللاعنفية مستوحى من حركة مناهضة الفصل العنصري في جنوب أفريقيا وقد اكتسب دعمًا عالميًا كبيرًا.</p>'
+            '<p class="l">فيما يلي قائمة مفصلة بالشركات التي تدعم إسرائيل مع الشرح، لتورطها في الإبادة الجماعية، والبدائل التي يمكنك استخدامها بدلاً منها.</p>'
+        ),
+        "support_gaza": (
+            '<h3>كيفية دعم غزة</h3>'
+            '<ol class="s">'
+            '<li><span class="cb">مقاطعة المنتجات:</span> تجنب شراء منتجات من الشركات التي تدعم إسرائيل</li>'
+            '<li><span class="cb">اختيار البدائل:</span> استخدم البدائل المقترحة أو ابحث عن خيارات محلية</li>'
+            '<li><span class="cb">نشر الوعي:</span> شارك المعلومات حول الوضع في غزة</li>'
+            '<li><span class="cb">التبرع:</span> دعم المنظمات الإنسانية العاملة في غزة</li>'
+            '<li><span class="cb">المناصرة:</span> اتصل بممثليك للمطالبة باتخاذ إجراءات</li>'
+            '<li><span class="cb">الانضمام إلى الاحتجاجات:</span> المشاركة في المظاهرات السلمية</li>'
+            '</ol>'
+            '<p class="l n">تذكر أن الضغط الاقتصادي من خلال المقاطعة كان تاريخياً استراتيجية مقاومة لاعنفية فعالة.</p>'
+        ),
+        "bds": (
+            '<h3>حركة المقاطعة وسحب الاستثمارات وفرض العقوبات (BDS)</h3>'
+            '<p class="l">تم إطلاق حركة المقاطعة في عام 2005 من قبل المجتمع المدني الفلسطيني. وهي تدعو إلى ثلاثة إجراءات رئيسية:</p>'
+            '<ol class="s">'
+            '<li><span class="cb">المقاطعة:</span> رفض شراء المنتجات والخدمات من الشركات المتواطئة في الاحتلال</li>'
+            '<li><span class="cb">سحب الاستثمارات:</span> سحب الاستثمارات من الشركات والمؤسسات التي تستفيد من الاحتلال</li>'
+            '<li><span class="cb">العقوبات:</span> الضغط من أجل فرض عقوبات على إسرائيل حتى تمتثل للقانون الدولي</li>'
+            '</ol>'
+            '<p class="l">لحركة المقاطعة ثلاثة مطالب أساسية:</p>'
+            '<ol class="s">'
+            '<li>إنهاء الاحتلال والاستعمار لجميع الأراضي العربية</li>'
+            '<li>الاعتراف بالحقوق الأساسية للمواطنين العرب الفلسطينيين في إسرائيل للمساواة الكاملة</li>'
+            '<li>احترام وحماية وتعزيز حقوق اللاجئين الفلسطينيين في العودة إلى ديارهم وممتلكاتهم</li>'
+            '</ol>'
+            '<p class="l">لمزيد من المعلومات، قم بزيارة <a href="https://bdsmovement.net/" class="s">الموقع الرسمي لحركة المقاطعة</a>.</p>'
+        ),
+        "education_intro": (
+            '<h2>موارد تعليمية عن فلسطين</h2>'
+            '<p class="l">يوفر هذا القسم موارد تعليمية لمساعدتك على معرفة المزيد عن فلسطين وتاريخها وثقافتها ووضعها الحالي. '
+            'تستند المعلومات المقدمة هنا إلى مصادر موثوقة، بما في ذلك تقارير من منظمات حقوق الإنسان، ووثائق الأمم المتحدة، والدراسات الأكاديمية، والشهادات المباشرة.</p>'
+        ),
+        "reading": (
+            '<h3>قراءات ومشاهدات موصى بها</h3>'
+            '<h4>كتب</h4>'
+            '<ul>'
+            "<li><strong>'مسألة فلسطين'</strong> لإدوارد سعيد</li>"
+            "<li><strong>'الموسوعة اليهودية والصهيونية وإسرائيل'</strong> لعبد الوهاب المسيري</li>"
+            "<li><strong>'التطهير العرقي في فلسطين'</strong> لإيلان بابيه</li>"
+            "<li><strong>'غزة في أزمة'</strong> لنعوم تشومسكي وإيلان بابيه</li>"
+            "<li><strong>'حرب المائة عام على فلسطين'</strong> لرشيد الخالدي</li>"
+            '</ul>'
+            '<h4>أفلام وثائقية</h4>'
+            '<ul>'
+            "<li><strong>'خمس كاميرات محطمة'</strong> (2011) لعماد برناط وغاي دافيدي</li>"
+            "<li><strong>'ملح هذا البحر'</strong> (2008) لآن ماري جاسر</li>"
+            "<li><strong>'غزة تقاتل من أجل الحرية'</strong> (2019) لآبي مارتن</li>"
+            "<li><strong>'احتلال 101'</strong> (2006) لسفيان عميش وعبد الله عميش</li>"
+            "<li><strong>'المطلوبون الـ18'</strong> (2014) لعامر الشوملي وبول كوان</li>"
+            '</ul>'
+            '<h4>مواقع موثوقة</h4>'
+            '<ul>'
+            '<li><a href="https://www.aljazeera.com/palestine-israel-conflict/">الجزيرة</a> - تغطية شاملة لقضايا الشرق الأوسط</li>'
+            '<li><a href="https://www.btselem.org/">بتسيلم</a> - مركز المعلومات الإسرائيلي لحقوق الإنسان في الأراضي المحتلة</li>'
+            '<li><a href="https://www.palestine-studies.org/">معهد الدراسات الفلسطينية</a> - أبحاث أكاديمية حول فلسطين</li>'
+            '<li><a href="https://www.unrwa.org/">الأونروا</a> - وكالة الأمم المتحدة لإغاثة وتشغيل اللاجئين الفلسطينيين</li>'
+            '<li><a href="https://electronicintifada.net/">الانتفاضة الإلكترونية</a> - أخبار وتعليقات وتحليلات ومواد مرجعية حول فلسطين</li>'
+            '</ul>'
+        ),
+    },
+}
@@ -0,0 +1,160 @@
+# HTML of the catalog pages, built from catalog records without any Streamlit call, so
+# it can be rendered once per catalog version and reused by every session
+from page_sections import PAGE_SECTIONS
+
+
+# Labels and text direction of the catalog pages, per language
+CONTENT_LABELS = {
+    "en": {
+        "dir": "ltr",
+        "reason": "Reason for boycott:",
+        "action": "Recommended action:",
+        "alternatives": "Alternatives:",
+        "key_facts": "Key Facts:",
+        "sources": "Sources:",
+        "category": "Category",
+        "company": "Company",
+        "resource": "Resource",
+        "search": "Search a company or brand",
+        "search_placeholder": "e.g. Starbucks, Lay's, L'Oréal or a barcode",
+        "no_match": "No company or brand on the list matches this name.",
+        "listed_in": "Listed in:",
+        "mentioned": "From our boycott list:",
+        "owned_by": "Owned by",
+        "shopping_list": "Check a shopping list",
+        "shopping_list_help": "One product per line",
+        "shopping_list_upload": "Or upload a CSV or text file",
+        "shopping_list_check": "Check list",
+        "shopping_list_empty": "The list is empty.",
+        "shopping_list_flagged": "products are on the boycott lists",
+        "shopping_list_download": "Download results (CSV)",
+    },
+    "ar": {
+        "dir": "rtl",
+        "reason": "سبب المقاطعة:",
+        "action": "الإجراء الموصى به:",
+        "alternatives": "البدائل:",
+        "key_facts": "حقائق رئيسية",
+        "sources": "المصادر",
+        "category": "الفئة",
+        "company": "الشركة",
+        "resource": "المورد",
+        "search": "ابحث عن شركة أو علامة تجارية",
+        "search_placeholder": "مثال: ستاربكس، بيبسي، لوريال أو رمز شريطي",
+        "no_match": "لا توجد شركة أو علامة تجارية في القائمة بهذا الاسم.",
+        "listed_in": "مدرجة في:",
+        "mentioned": "من قائمة المقاطعة لدينا:",
+        "owned_by": "مملوكة لـ",
+        "shopping_list": "تحقق من قائمة التسوق",
+        "shopping_list_help": "منتج واحد في كل سطر",
+        "shopping_list_upload": "أو ارفع ملف CSV أو ملفًا نصيًا",
+        "shopping_list_check": "تحقق من القائمة",
+        "shopping_list_empty": "القائمة فارغة.",
+        "shopping_list_flagged": "منتجات موجودة في قوائم المقاطعة",
+        "shopping_list_download": "تنزيل النتائج (CSV)",
+    },
+}
+
+
+# Theme of every generated block. Blocks only carry a `pa` container (with the text
+# direction) and a few short classes; everything else is styled by element, so the
+# markup stays small. Sent once per page as one <style> element (see theme_html).
+THEME_CSS = (
+    "div.pa{font-family:Arial,Helvetica,sans-serif;line-height:1.6}"
+    "div.pa h1,div.pa h2,div.pa h3{font-weight:700}"
+    "div.pa h2,div.pa h3{color:#1f77b4}"
+    "div.pa h2{margin-bottom:20px}"
+    "div.pa h3{margin:20px 0 15px}"
+    "div.pa h3.sub{color:inherit;font-weight:600;margin:15px 0 10px}"
+    "div.pa h4{font-weight:600;color:#2ca02c;margin:15px 0 10px}"
+    "div.pa p{margin-bottom:10px}"
+    "div.pa .l{font-size:1.05em;margin-bottom:15px}"
+    "div.pa[dir=rtl] .l{text-align:justify}"
+    "div.pa .n{font-style:italic}"
+    "div.pa .s,div.pa strong{font-weight:600}"
+    "div.pa ol,div.pa ul{padding-inline-start:20px;margin-bottom:20px}"
+    "div.pa li{margin-bottom:8px}"
+    "div.pa[dir=rtl] ol{list-style-type:arabic-indic}"
+    "div.pa .cols{display:grid;grid-template-columns:repeat(auto-fit,minmax(18rem,1fr));gap:0 2rem}"
+    "div.pa a{color:#1f77b4;text-decoration:underline}"
+    "div.pa .cr{color:#d62728}div.pa .cg{color:#2ca02c}div.pa .cb{color:#1f77b4}"
+    "div.pa blockquote{border:0;border-inline-start:4px solid #1f77b4;padding:0;"
+    "padding-inline-start:15px;margin-inline-start:0;font-size:1.1em}"
+    "div.pa blockquote p{color:#1f77b4;font-weight:600;font-size:1.3em}"
+    "div.pa blockquote footer{text-align:end;font-style:italic;font-weight:500}"
+    "div.pa.ctr{text-align:center}"
+)
+
+
+def theme_html():
+    return f"<style>{THEME_CSS}</style>"
+
+
+# `html` in a themed container with the text direction of `language`
+def block(html, language, css_class="pa"):
+    return f'<div class="{css_class}" dir="{CONTENT_LABELS[language]["dir"]}">{html}</div>'
+
+
+# Category title shown at the top of a catalog tab
+def category_title_html(category, language):
+    return block(f"<h3>{category.text('name', language)}</h3>", language)
+
+
+# Reason, recommended action and alternatives of one boycotted company
+def company_html(company, language):
+    labels = CONTENT_LABELS[language]
+    return block(
+        f'<p><strong class="cr">{labels["reason"]}</strong> {company.text("reason", language)}</p>'
+        f'<p><strong class="cg">{labels["action"]}</strong> {company.text("action", language)}</p>'
+        f'<p><strong class="cb">{labels["alternatives"]}</strong> {", ".join(company.text("alternatives", language))}</p>',
+        language,
+    )
+
+
+# A name that is only in a brand list: the list and its alternatives
+def brand_list_html(brand_list, language):
+    labels = CONTENT_LABELS[language]
+    return block(
+        f'<p><strong class="cr">{labels["listed_in"]}</strong> {brand_list.text("name", language)}</p>'
+        f'<p><strong class="cb">{labels["alternatives"]}</strong> {", ".join(brand_list.text("alternatives", language))}</p>',
+        language,
+    )
+
+
+# Description, key facts and sources of an education resource as one block, with the
+# facts and sources as real lists
+def resource_html(catalog, resource, language):
+    labels = CONTENT_LABELS[language]
+    facts = "".join(f"<li>{fact}</li>" for fact in resource.text("key_facts", language))
+    sources = "".join(f'<li><a href="{source.url}">{source.name}</a></li>'
+                      for source in catalog.sources_of(resource, language))
+    return block(
+        f'<p class="l">{resource.text("description", language)}</p>'
+        f'<h4>{labels["key_facts"]}</h4><ul>{facts}</ul>'
+        f'<h4>{labels["sources"]}</h4><ul>{sources}</ul>',
+        language,
+    )
+
+
+# Every fragment of a catalog, per language: {language: {(kind, record id): html}} for
+# categories, companies, brand lists and education resources, plus the static page
+# sections as ("page", section name)
+def render_catalog(catalog):
+    html = {}
+    for language in catalog.languages:
+        fragments = {}
+        for category in catalog.boycott_categories:
+            fragments[("boycott_category", category.id)] = category_title_html(category, language)
+        for category in catalog.education_categories:
+            fragments[("education_category", category.id)] = category_title_html(category, language)
+        for company in catalog.companies:
+            fragments[("company", company.id)] = company_html(company, language)
+        for brand_list in catalog.brand_lists:
+            fragments[("brand_list", brand_list.id)] = brand_list_html(brand_list, language)
+        for resource in catalog.resources:
+            if resource.has_language(language):
+                fragments[("resource", resource.id)] = resource_html(catalog, resource, language)
+        for name, html_body in PAGE_SECTIONS.get(language, {}).items():
+            fragments[("page", name)] = block(html_body, language)
+        html[language] = fragments
+    return html
@@ -0,0 +1,168 @@
+import functools
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+import streamlit as st
+
+# Render profile of every rerun: the elements and bytes of markdown/HTML emitted through
+# emit_markdown, the script time of each section (sidebar, hero, page, fragment) and
+# what triggered the rerun. The last RECENT_PROFILES profiles of a session are kept for
+# the debug panel; with RENDER_PROFILE_LOG=1 every profile is also logged to stderr.
+
+LOG_PROFILES = os.getenv("RENDER_PROFILE_LOG") == "1"
+RECENT_PROFILES = 20
+
+# Session state keys of the profiler itself, never a rerun trigger
+_OWN_KEYS = ("rerun_profile", "rerun_profiles", "rerun_stats", "rerun_widgets", "rerun_page", "render_debug")
+
+
+class RerunProfile:
+    __slots__ = ("scope", "trigger", "elapsed", "sections", "_stack", "_start")
+
+    def __init__(self, scope, trigger):
+        self.scope = scope
+        self.trigger = trigger
+        self.elapsed = 0.0
+        # name -> [elements, bytes, seconds]. Elements count towards the innermost
+        # section; the time of a section includes the sections inside it.
+        self.sections = {}
+        self._stack = []
+        self._start = time.perf_counter()
+
+    def _section(self, name):
+        return self.sections.setdefault(name, [0, 0, 0.0])
+
+    def count(self, size):
+        entry = self._section(self._stack[-1] if self._stack else "other")
+        entry[0] += 1
+        entry[1] += size
+
+    def elements(self):
+        return sum(entry[0] for entry in self.sections.values())
+
+    def bytes(self):
+        return sum(entry[1] for entry in self.sections.values())
+
+    def summary(self):
+        sections = ", ".join(f"{name} {elements}/{size / 1024:.1f}KB/{seconds * 1000:.1f}ms"
+                             for name, (elements, size, seconds) in self.sections.items())
+        return (f"{self.scope} rerun ({self.trigger}): {self.elements()} elements, "
+                f"{self.bytes() / 1024:.1f} KB, {self.elapsed * 1000:.1f} ms [{sections}]")
+
+
+def _widget_values():
+    return {key: value for key, value in st.session_state.items()
+            if key not in _OWN_KEYS and isinstance(value, (str, int, float, bool, type(None)))}
+
+
+# What made this rerun happen: the widgets whose value changed since the last rerun
+# ended, a page change, the first load, or "rerun" (a widget without a key, st.rerun)
+def _trigger(page):
+    previous = st.session_state.get("rerun_widgets")
+    if previous is None:
+        return "load"
+    current = _widget_values()
+    changed = [key for key in current if previous.get(key) != current[key]]
+    # Buttons are True for one rerun only; falling back to False is not an interaction
+    pressed = [key for key in changed if not (previous.get(key) is True and current[key] is False)]
+    if pressed or changed:
+        return "widget: " + ", ".join(pressed or changed)
+    if page is not None and page != previous.get("rerun_page"):
+        return f"page: {page}"
+    return "rerun"
+
+
+def start_rerun(scope, page=None):
+    profile = RerunProfile(scope, _trigger(page))
+    st.session_state.rerun_profile = profile
+    st.session_state.rerun_page = page if page is not None else st.session_state.get("rerun_page")
+    return profile
+
+
+def finish_rerun():
+    profile = st.session_state.pop("rerun_profile", None)
+    if profile is None:
+        return
+    profile.elapsed = time.perf_counter() - profile._start
+    recent = st.session_state.setdefault("rerun_profiles", [])
+    recent.append(profile)
+    del recent[:-RECENT_PROFILES]
+    stats = st.session_state.setdefault("rerun_stats", {})
+    runs, total = stats.get(profile.scope, (0, 0.0))
+    stats[profile.scope] = (runs + 1, total + profile.elapsed)
+    widgets = _widget_values()
+    widgets["rerun_page"] = st.session_state.get("rerun_page")
+    st.session_state.rerun_widgets = widgets
+    if LOG_PROFILES:
+        print(profile.summary(), file=sys.stderr)
+
+
+@contextmanager
+def section(name):
+    profile = st.session_state.get("rerun_profile")
+    if profile is None:
+        yield
+        return
+    profile._stack.append(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile._section(name)[2] += time.perf_counter() - start
+        profile._stack.pop()
+
+
+# st.markdown (or `target.markdown`, e.g. an st.empty slot), counted in the profile of
+# the current rerun
+def emit_markdown(body, target=st, **kwargs):
+    profile = st.session_state.get("rerun_profile")
+    if profile is not None:
+        profile.count(len(body.encode("utf-8")))
+    return target.markdown(body, **kwargs)
+
+
+# st.fragment profiled as a section of the whole-script run it is part of, or as a rerun
+# of its own when it reruns alone
+def tracked_fragment(scope):
+    def decorate(function):
+        @functools.wraps(function)
+        def run(*args, **kwargs):
+            if "rerun_profile" in st.session_state:
+                with section(scope):
+                    return function(*args, **kwargs)
+            start_rerun(scope)
+            try:
+                with section(scope):
+                    return function(*args, **kwargs)
+            finally:
+                finish_rerun()
+        return st.fragment(run)
+    return decorate
+
+
+# Debug panel of the session: ?debug=1 in the URL turns it on, ?debug=0 off. Shows the
+# reruns of every scope and the profiles of the last reruns, newest first. The rerun in
+# progress is not finished yet, so it appears on the next one.
+def render_debug_panel():
+    if "debug" in st.query_params:
+        st.session_state.render_debug = st.query_params["debug"] == "1"
+    if not st.session_state.get("render_debug"):
+        return
+    with st.expander("Render profile", expanded=True):
+        stats = st.session_state.get("rerun_stats", {})
+        st.caption(" · ".join(f"{scope}: {runs} reruns, {total / runs * 1000:.1f} ms avg"
+                              for scope, (runs, total) in stats.items()))
+        st.dataframe([
+            {
+                "scope": profile.scope,
+                "trigger": profile.trigger,
+                "elements": profile.elements(),
+                "KB": round(profile.bytes() / 1024, 1),
+                "ms": round(profile.elapsed * 1000, 1),
+                "sections": ", ".join(f"{name} {elements}/{size / 1024:.1f}KB/{seconds * 1000:.0f}ms"
+                                      for name, (elements, size, seconds) in profile.sections.items()),
+            }
+            for profile in reversed(st.session_state.get("rerun_profiles", []))
+        ], use_container_width=True, hide_index=True)
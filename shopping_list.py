@@ -0,0 +1,124 @@
+import csv
+import io
+
+from barcodes import lookup_barcode
+from catalog import Brand, Company
+from catalog_search import normalize_name
+from catalog_state import current
+
+# Batch check of a shopping list or product CSV against the boycott catalog. Every
+# distinct line is normalized once and scanned with the index's compiled name pattern
+# (one regex pass per line, whatever the number of companies); only lines with no exact
+# name or alias fall back to fuzzy search, word by word, with a memo shared by the batch.
+# Brands resolve to the boycotted companies that own them; barcode lines are looked up
+# by their GS1 company prefix. Ambiguous names ("apple juice", "cat food") only count
+# next to one of their record's context words, and never as a fuzzy match.
+
+# Smallest fuzzy score for a word to count as a misspelled name
+MIN_FUZZY_SCORE = 0.75
+# Shorter words are too ambiguous for fuzzy matching ("tea", "mac")
+MIN_FUZZY_LENGTH = 4
+
+RESULT_FIELDS = ("line", "status", "match", "match_type", "companies", "alternatives")
+# Column names that hold the product in an uploaded CSV; otherwise the first column
+PRODUCT_COLUMNS = ("product", "name", "item", "brand", "المنتج")
+
+
+# Lines of a pasted list or an uploaded .csv/.txt file (text or bytes)
+def read_shopping_list(content, filename=""):
+    if isinstance(content, bytes):
+        content = content.decode("utf-8-sig", errors="replace")
+    if not filename.lower().endswith(".csv"):
+        return [line.strip() for line in content.splitlines() if line.strip()]
+
+    rows = [row for row in csv.reader(io.StringIO(content)) if any(cell.strip() for cell in row)]
+    if not rows:
+        return []
+    header = [cell.strip().casefold() for cell in rows[0]]
+    column = next((header.index(name) for name in PRODUCT_COLUMNS if name in header), None)
+    if column is None:
+        column = 0
+    else:
+        rows = rows[1:]
+    return [row[column].strip() for row in rows if len(row) > column and row[column].strip()]
+
+
+# How a name matched its record: one of its names or an alias. Brand-list entries are
+# names only.
+def _name_type(record, name):
+    if isinstance(record, (Company, Brand)) and name not in record.name:
+        return "alias"
+    return "exact"
+
+
+def check_shopping_list(lines, language="en"):
+    snapshot = current()
+    index = snapshot.search
+    ownership = snapshot.ownership
+    fuzzy_memo = {}
+    line_memo = {}
+
+    def fuzzy_word(word):
+        if word not in fuzzy_memo:
+            matches = index.search(word, limit=3) if len(word) >= MIN_FUZZY_LENGTH else []
+            fuzzy_memo[word] = next((match for match in matches
+                                     if match.score >= MIN_FUZZY_SCORE and not index.is_ambiguous(match)), None)
+        return fuzzy_memo[word]
+
+    def check(normalized):
+        # (record, matched name, match type)
+        matches = []
+        # Barcodes (e.g. a product export) go through the GS1 prefix table
+        record = lookup_barcode(normalized, snapshot.catalog) if normalized.isdigit() else None
+        if record is not None:
+            matches.append((record, record.text("name", language), "barcode"))
+        else:
+            for entry in index.scan(normalized):
+                _, name, record = index.entries[entry]
+                matches.append((record, name, _name_type(record, name)))
+        if not matches:
+            for word in normalized.split():
+                match = fuzzy_word(word)
+                if match is not None:
+                    matches.append((match.record, match.name, "fuzzy"))
+
+        companies, alternatives = {}, []
+        for record, _, _ in matches:
+            if isinstance(record, (Company, Brand)):
+                for company in ownership.boycotted_owners(record.id):
+                    companies.setdefault(company.id, company)
+            else:
+                # Only named in a brand list
+                alternatives.extend(record.text("alternatives", language))
+        for company in companies.values():
+            alternatives.extend(company.text("alternatives", language))
+
+        if companies:
+            status = "boycott"
+        elif matches:
+            status = "listed"
+        else:
+            status = "clear"
+        return {
+            "status": status,
+            "match": ", ".join(dict.fromkeys(name for _, name, _ in matches)),
+            "match_type": ", ".join(dict.fromkeys(match_type for _, _, match_type in matches)),
+            "companies": ", ".join(company.text("name", language) for company in companies.values()),
+            "alternatives": ", ".join(dict.fromkeys(alternatives)),
+        }
+
+    results = []
+    for line in lines:
+        normalized = normalize_name(line)
+        if normalized not in line_memo:
+            line_memo[normalized] = check(normalized)
+        results.append({"line": line, **line_memo[normalized]})
+    return results
+
+
+def results_to_csv(results):
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=RESULT_FIELDS)
+    writer.writeheader()
+    writer.writerows(results)
+    return output.getvalue()